@@ -1,23 +1,92 @@
 from __future__ import annotations
 
-from typing import TypeVar
+from typing import TypeVar, Generic, List, Sequence, Iterator, Callable
+from contextlib import contextmanager
 from numbers import Number
+from fractions import Fraction
+from itertools import chain
 import math
 
 from vector import Vector
-from matrix import Matrix
+from matrix import Matrix, _dtype_of
+from lazy import Expr, lazy, lazy_mode, is_lazy
+from sparse import SparseMatrix, sparse_mat_vec_mul, sparse_mat_mat_mul, sparse_transpose, sparse_trace
+from batch import MatrixBatch, VectorBatch, batch_determinant, batch_inverse, batch_mat_vec_mul, batch_mat_mat_mul
+from soa import ComplexMatrix, ComplexVector, soa_mat_mat_mul, soa_mat_vec_mul, soa_dot
+from sumprod import _math_sumprod, _sumprod, _sumprod_generic
+from codegen import CODEGEN_MAX_DET, kernel, kernel_source, kernel_cache_clear, specialized
+from parallel import free_threaded, parallel_mat_mat_mul, row_chunks, shared_rows, thread_map, worth_parallel
+from gf2 import GF2Matrix, gf2_rank, gf2_row_echelon, gf2_inverse, gf2_mat_mat_mul
+from packed import (PackedMatrix, packed_determinant, packed_inverse, packed_mat_vec_mul, packed_syrk,
+                    packed_trace, packed_transpose, packed_triangular_solve)
 
 T = TypeVar("T", bound = Number)
 _EPS = 1e-10 # pivot tolerance for float inputs
 ROUND = 7 # digits to round floats in row_echelon post-processing
+BLOCK_SIZE = 64 # tile edge of the blocked mat_mat_mul kernel
+STRASSEN_CROSSOVER = 64 # Strassen–Winograd recursion stops below this edge
+MATMUL_ALGORITHMS = ("blocked", "strassen")
+PANEL_SIZE = 32 # columns eliminated per panel before the deferred trailing update
+_REAL_DTYPES = ("float", "int") # element-type tags served by the C-level float kernels
+
+def _storage_owner(x):
+    """The object owning x's storage: the base matrix of a view, else x."""
+    base = getattr(x, "_base", None)
+    return x if base is None else base
+
+
+def _check_out(out, shape: tuple, *operands) -> None:
+    """Validate an out= destination: right shape and no storage shared with an
+    operand (a view over an input would be overwritten while it is read)."""
+    out_shape = out.shape() if isinstance(out, Matrix) else (len(out),)
+    if out_shape != shape:
+        raise ValueError(f"out has shape {out_shape}, expected {shape}")
+    owner = _storage_owner(out)
+    if any(owner is _storage_owner(x) for x in operands):
+        raise ValueError("out must not share storage with an input")
+    _fit_out(out, operands)
+
+
+def _real_tag(x) -> str:
+    """dtype tag of a Matrix, Vector or scalar, with int/float mixes reported as "float"."""
+    if isinstance(x, Matrix):
+        tag, values = x.dtype, [v for row in x._m for v in row]
+    elif isinstance(x, Vector):
+        tag, values = x.dtype, x
+    else:
+        tag, values = _dtype_of((x,)), (x,)
+    if tag == "mixed" and all(type(v) in (int, float) for v in values):
+        return "float"
+    return tag
+
+
+def _fit_out(out, operands) -> None:
+    """Prepare an array-storage destination for the result of `operands`
+    (Matrices, Vectors and scalars): int64 is widened to float64 before a
+    kernel writes floats into it, other result types are rejected."""
+    if out.storage != "array":
+        return
+    tags = {_real_tag(x) for x in operands}
+    if tags <= {"int"}:
+        return
+    if tags <= {"int", "float"}:
+        out._widen((0.0,)) # no-op unless out holds int64
+        return
+    raise ValueError(f"out has array storage and cannot hold {'/'.join(sorted(tags))} results")
+
 
 def linear_combination(
     vectors: Sequence[Vector[T]],
     coefs: Sequence[T],
+    out: Vector[T] | None = None,
 ) -> Vector[T]:
     """
     Return the linear combination of a sequence of vectors with given coefficients.
-    The result is a new Vector instance containing the sum of each vector scaled by its coefficient.
+    The result is a new Vector instance containing the sum of each vector scaled by its coefficient,
+    or `out` overwritten in place when given (no new Vector is allocated).
+
+    Without float fma, the whole sum is one fused lazy expression: a single
+    pass over the coordinates instead of one sweep of the accumulator per vector.
 
     Complexity
     ----------
@@ -33,15 +102,28 @@ def linear_combination(
     if any(len(v) != dim for v in vectors):
         raise ValueError("All vectors must have the same dimension")
 
-    # build an all-zeros accumulator of the right numeric type
-    zero: T = coefs[0] - coefs[0] # zero of the same type as coefs
-    acc = [zero] * dim
-
     # use fused multiply-add if available, otherwise do two separate ops
     # this is a CPython-specific optimization to reduce rounding errors
     # fma is a function that computes a * b + c in one step
     fma = getattr(math, "fma", None)  # fused multiply-add if CPython has it
 
+    if out is None and (fma is None or not any(isinstance(a, float) for a in coefs)):
+        # a0·u0 + a1·u1 + … evaluated element by element in one fused loop
+        expr = lazy(vectors[0]) * coefs[0] # Expr.__mul__ emits coef * element
+        for a, u in zip(coefs[1:], vectors[1:]):
+            expr = expr + lazy(u) * a
+        return expr.eval()
+
+    # build an all-zeros accumulator of the right numeric type
+    zero: T = coefs[0] - coefs[0] # zero of the same type as coefs
+    if out is not None:
+        _check_out(out, (dim,), *vectors, *coefs)
+        acc = out._data
+        for i in range(dim):
+            acc[i] = zero
+    else:
+        acc = [zero] * dim
+
     for a, u in zip(coefs, vectors):
         if fma is not None and isinstance(a, float):
             # fused multiply-add gives one rounding error instead of two
@@ -51,7 +133,10 @@ def linear_combination(
             for i in range(dim):
                 acc[i] += a * u[i]
 
-    return Vector(acc)
+    if out is not None:
+        out._touch()
+        return out
+    return Vector._like(acc, vectors[0].storage)
 
 
 def lerp(u, v, t: float):
@@ -73,9 +158,9 @@ def lerp(u, v, t: float):
             return math.fma(t, v - u, u)
         return u + t * (v - u)
 
-    # vector or matrix
+    # vector or matrix: one fused pass, no temporaries for v - u and t·(v - u)
     if isinstance(u, (Vector, Matrix)):
-        return u + t * (v - u)
+        return (lazy(u) + t * (lazy(v) - lazy(u))).eval()
 
     # other types are not supported in this exercise
     raise TypeError(f"Unsupported type: {type(u).__name__}")
@@ -87,6 +172,8 @@ def dot(u: Vector[T], v: Vector[T]) -> T:
     Time complexity  : Θ(n)   (coordinates)
     Space complexity : Θ(1)   (single accumulator)
     """
+    if isinstance(u, ComplexVector) or isinstance(v, ComplexVector):
+        return soa_dot(u, v)
     if len(u) != len(v):
         raise ValueError("Vector size mismatch in dot product")
 
@@ -97,13 +184,20 @@ def dot(u: Vector[T], v: Vector[T]) -> T:
     fma = getattr(math, "fma", None)
 
     # Fused multiply‑add for floats
-    if fma is not None and all(isinstance(x, float) for x in (*u, *v)):
+    if fma is not None and u.dtype == "float" and v.dtype == "float":
         for a, b in zip(u, v):
             total = fma(a, b, total)
     else:
-        for a, b in zip(u, v):
-            a2 = a.conjugate() if hasattr(a, "conjugate") else a # handle complex numbers
-            total += a2 * b
+        # conjugate u once per call by dtype: the identity for real tags, a
+        # bound-method map for complex ones, a per-element check only if mixed
+        if u.dtype in ("float", "int", "Fraction"):
+            conj_u = u
+        elif u.dtype in ("Complex", "complex"):
+            conj_u = map(type(u[0]).conjugate, u)
+        else:
+            conj_u = (a.conjugate() if hasattr(a, "conjugate") else a for a in u)
+        for a, b in zip(conj_u, v):
+            total += a * b
 
     return total
 
@@ -160,8 +254,8 @@ def angle_cos(u: Vector[T], v: Vector[T]) -> float:
     return num_real / (du * dv)
 
 
-def cross_product(u: Vector[T], v: Vector[T]) -> Vector[T]:
-    """Return the 3‑D cross product u × v.
+def cross_product(u: Vector[T], v: Vector[T], out: Vector[T] | None = None) -> Vector[T]:
+    """Return the 3‑D cross product u × v (written into `out` if given; may alias u or v).
 
     Time complexity: Θ(1)   (a constant 9 multiplies/adds)
     Space complexity: Θ(1)   (one new 3‑element Vector)
@@ -174,7 +268,7 @@ def cross_product(u: Vector[T], v: Vector[T]) -> Vector[T]:
 
     fma = getattr(math, "fma", None)
 
-    if fma is not None and all(isinstance(x, float) for x in (ux, uy, uz, vx, vy, vz)):
+    if fma is not None and u.dtype == "float" and v.dtype == "float":
         cx = fma(uy, vz, -uz * vy)   # uy*vz − uz*vy
         cy = fma(uz, vx, -ux * vz)   # uz*vx − ux*vz
         cz = fma(ux, vy, -uy * vx)   # ux*vy − uy*vx
@@ -183,15 +277,31 @@ def cross_product(u: Vector[T], v: Vector[T]) -> Vector[T]:
         cy = uz * vx - ux * vz
         cz = ux * vy - uy * vx
 
-    return Vector([cx, cy, cz])
+    if out is not None:
+        _check_out(out, (3,), u, v)
+        out._data[0], out._data[1], out._data[2] = cx, cy, cz
+        out._touch()
+        return out
+    return Vector._like([cx, cy, cz], u.storage)
 
 
-def mat_vec_mul(mat: Matrix[T], u: Vector[T]) -> Vector[T]:
-    """Return the matrix–vector product A·u.
+def mat_vec_mul(mat: Matrix[T], u: Vector[T], out: Vector[T] | None = None,
+                threads: int | None = None) -> Vector[T]:
+    """Return the matrix–vector product A·u (written into `out` if given).
+    Small shapes seen more than once run a cached unrolled kernel (see codegen.py).
+    `threads` > 1 splits the rows over a thread pool on free-threaded builds.
 
     Time complexity  : O(nm)   (n=rows, m=cols)
     Space complexity : O(m)    (m=rows, result vector)
     """
+    if isinstance(mat, SparseMatrix):
+        return sparse_mat_vec_mul(mat, u, out)
+    if isinstance(mat, MatrixBatch):
+        return batch_mat_vec_mul(mat, u)
+    if isinstance(mat, ComplexMatrix) or isinstance(u, ComplexVector):
+        return soa_mat_vec_mul(mat, u)
+    if isinstance(mat, PackedMatrix):
+        return packed_mat_vec_mul(mat, u)
     m, n = mat.shape()
     if m == 0 or n == 0:
         raise ValueError("Matrix cannot be empty")
@@ -200,53 +310,428 @@ def mat_vec_mul(mat: Matrix[T], u: Vector[T]) -> Vector[T]:
 
     fma = getattr(math, "fma", None)
     zero: T = u[0] - u[0]
-    out = []
+    if out is not None:
+        _check_out(out, (m,), mat, u)
+        vals = out._data
+    else:
+        vals = [zero] * m
+    use_fma = fma is not None and mat.dtype == "float" and u.dtype == "float" # dispatch once per call
+    kern = None if out is not None else specialized("mat_vec_mul", (m, n), mat.dtype, "fma" if use_fma else "chain")
+    if kern is not None: # repeated small shape: unrolled straight-line kernel
+        return Vector._like(kern(mat._m, u._data), mat.storage)
+
+    rows = mat._m
+    def fill(bounds: tuple[int, int]) -> None:
+        for i in range(*bounds):
+            row = rows[i] # direct row access, no column cache
+            if use_fma:
+                acc = 0.0
+                for a, b in zip(row, u):
+                    acc = fma(a, b, acc)
+            else:
+                acc = zero
+                for a, b in zip(row, u):
+                    acc += a * b
+            vals[i] = acc
 
-    for row in mat._m:  # direct row access, no column cache
-        if fma is not None and all(isinstance(x, float) for x in (*row, *u)):
-            acc = 0.0
-            for a, b in zip(row, u):
-                acc = fma(a, b, acc)
-        else:
-            acc = zero
-            for a, b in zip(row, u):
-                acc += a * b
-        out.append(acc)
+    with thread_map(threads) as run:
+        run(fill, m, m * n)
 
-    return Vector(out)
+    if out is not None:
+        out._touch()
+        return out
+    return Vector._like(vals, mat.storage)
 
 
-def mat_mat_mul(mat1: Matrix[T], mat2: Matrix[T]) -> Matrix[T]:
-    """Return the matrix–matrix product A·B.
+def _mat_mat_mul_blocked(rows1, cols2, result, m: int, n: int, p: int, block: int,
+                         dotk, alpha: T | None = None) -> None:
+    """Tiled kernel: C[ii:, jj:] += α·A[ii:, kk:] · B[kk:, jj:] tile by tile, in place on result.
+
+    B is given by its columns (Bᵀ rows) and cut into panels along k, A into
+    row panels, so every inner product reads two contiguous slices of length
+    ≤ block. With n ≤ block there is a single panel: plain list / memoryview
+    rows are then read as they are, nothing is sliced or copied.
+    """
+    k_starts = range(0, n, block)
+    if n <= block and all(type(r) in (list, memoryview) for r in chain(rows1, cols2)):
+        a_panels, b_panels = [rows1], [cols2]
+    else:
+        a_panels = [[row[kk:kk + block] for row in rows1] for kk in k_starts]
+        b_panels = [[col[kk:kk + block] for col in cols2] for kk in k_starts]
+
+    for ii in range(0, m, block):
+        i_end = min(ii + block, m)
+        for jj in range(0, p, block):
+            j_end = min(jj + block, p)
+            for a_panel, b_panel in zip(a_panels, b_panels):
+                b_tile = b_panel[jj:j_end]
+                for i in range(ii, i_end):
+                    a = a_panel[i]
+                    out = result[i]
+                    if alpha is None:
+                        for j, b in enumerate(b_tile, jj):
+                            out[j] += dotk(a, b)
+                    else:
+                        for j, b in enumerate(b_tile, jj):
+                            out[j] += alpha * dotk(a, b)
+
+
+def _is_adjoint_pair(mat1: Matrix[T], mat2: Matrix[T]) -> bool:
+    """True when mat1 is mat2ᴴ (or mat2 is mat1ᴴ) over the same storage, so A·B is Hermitian."""
+    owner1 = mat1 if mat1._base is None else mat1._base
+    owner2 = mat2 if mat2._base is None else mat2._base
+    return (owner1 is owner2 and mat1._origin == mat2._origin and mat1._steps == mat2._steps
+            and mat1._transposed != mat2._transposed
+            and (mat1._conjugated != mat2._conjugated or mat1.dtype in ("float", "int", "Fraction")))
+
+
+def _hermitian_rows(rows1, cols2, result, rows: range, n: int, block: int, dotk) -> None:
+    """Upper triangle (j ≥ i) of rows `rows` of a Hermitian product, each entry
+    summed panel by panel exactly like _mat_mat_mul_blocked."""
+    k_starts = range(0, n, block)
+    for i in rows:
+        a, out = rows1[i], result[i]
+        for j in range(i, len(cols2)):
+            b = cols2[j]
+            acc = out[j]
+            for kk in k_starts:
+                acc += dotk(a[kk:kk + block], b[kk:kk + block])
+            out[j] = acc
+
+
+def _madd(X: List[list], Y: List[list]) -> List[list]:
+    return [[a + b for a, b in zip(x, y)] for x, y in zip(X, Y)]
+
+def _msub(X: List[list], Y: List[list]) -> List[list]:
+    return [[a - b for a, b in zip(x, y)] for x, y in zip(X, Y)]
+
+
+def _strassen(A: List[list], B: List[list], crossover: int, block: int, dotk, zero: T) -> List[list]:
+    """A·B on row lists by Strassen–Winograd (7 products, 15 additions per level).
+
+    Odd dimensions are peeled: the even leading part recurses and the last
+    row / column / inner index are fixed up with O(mp + mn + np) classical work.
+    At or below `crossover` along any dimension the blocked kernel takes over.
+    """
+    m, n, p = len(A), len(B), len(B[0])
+    if min(m, n, p) <= crossover:
+        C = [[zero] * p for _ in range(m)]
+        _mat_mat_mul_blocked(A, [list(col) for col in zip(*B)], C, m, n, p, block, dotk)
+        return C
+    h, k, q = m // 2, n // 2, p // 2 # quadrant edges of the even part
+    A11 = [row[:k] for row in A[:h]]
+    A12 = [row[k:2 * k] for row in A[:h]]
+    A21 = [row[:k] for row in A[h:2 * h]]
+    A22 = [row[k:2 * k] for row in A[h:2 * h]]
+    B11 = [row[:q] for row in B[:k]]
+    B12 = [row[q:2 * q] for row in B[:k]]
+    B21 = [row[:q] for row in B[k:2 * k]]
+    B22 = [row[q:2 * q] for row in B[k:2 * k]]
+
+    S1 = _madd(A21, A22)
+    S2 = _msub(S1, A11)
+    S3 = _msub(A11, A21)
+    S4 = _msub(A12, S2)
+    T1 = _msub(B12, B11)
+    T2 = _msub(B22, T1)
+    T3 = _msub(B22, B12)
+    T4 = _msub(T2, B21)
+
+    def rec(X, Y):
+        return _strassen(X, Y, crossover, block, dotk, zero)
+    P1 = rec(A11, B11)
+    U2 = _madd(P1, rec(S2, T2))
+    U3 = _madd(U2, rec(S3, T3))
+    P5 = rec(S1, T1)
+    C11 = _madd(P1, rec(A12, B21))
+    C12 = _madd(_madd(U2, P5), rec(S4, B22))
+    C21 = _msub(U3, rec(A22, T4))
+    C22 = _madd(U3, P5)
+    C = [r1 + r2 for r1, r2 in zip(C11, C12)] + [r1 + r2 for r1, r2 in zip(C21, C22)]
+
+    if n % 2: # inner index n-1: rank-1 fix-up of the even block
+        b_last = B[n - 1][:2 * q]
+        for row, a_row in zip(C, A):
+            a = a_row[n - 1]
+            row[:] = [x + a * b for x, b in zip(row, b_last)]
+    if p % 2: # last column of C: A[:2h]·B[:, p-1]
+        b_col = [row[p - 1] for row in B]
+        for row, a_row in zip(C, A):
+            row.append(dotk(a_row, b_col))
+    if m % 2: # last row of C: A[m-1]·B
+        a_last = A[m - 1]
+        C.append([dotk(a_last, col) for col in zip(*B)])
+    return C
+
+
+def mat_mat_mul(mat1: Matrix[T], mat2: Matrix[T], block: int | None = None,
+                out: Matrix[T] | None = None, processes: int | None = None,
+                threads: int | None = None, algorithm: str = "blocked",
+                crossover: int | None = None) -> Matrix[T]:
+    """Return the matrix–matrix product A·B using the cache-blocked kernel.
+
+    `block` is the tile edge (defaults to BLOCK_SIZE); tune it per machine.
+    `out` (dense operands only) receives the product in place instead of a new
+    Matrix; B's columns and the k panels are still packed per call (see gemm).
+    Small shapes seen more than once run a cached unrolled kernel (see codegen.py).
+    `processes` > 1 spreads output row blocks of float products with at least
+    parallel.PARALLEL_MIN_FLOPS multiply-adds over a process pool;
+    the result is bit-identical to the serial one. `threads` > 1 does the same
+    with a thread pool on free-threaded builds (serial under the GIL).
+    A product of a matrix and its adjoint() view (AᴴA, AAᴴ) is Hermitian: only
+    the upper triangle is computed and mirrored, about half the work.
+    algorithm="strassen" recurses with Strassen–Winograd down to `crossover`
+    (defaults to STRASSEN_CROSSOVER), then uses the blocked kernel: O(n^2.81)
+    for square products, with a slightly different rounding than "blocked".
 
     Time complexity  : O(nmp)   (n=rows, m=cols, p=cols2)
-    Space complexity : O(mp)    (m=rows, p=cols2, result matrix)
+    Space complexity : O(mp + nm + np)   (result matrix + packed panels of A and B)
     """
+    if out is not None and not (isinstance(mat1, Matrix) and isinstance(mat2, Matrix)):
+        raise TypeError("out= needs dense Matrix operands")
+    if isinstance(mat1, GF2Matrix) and isinstance(mat2, GF2Matrix):
+        return gf2_mat_mat_mul(mat1, mat2)
+    if isinstance(mat1, SparseMatrix) or isinstance(mat2, SparseMatrix):
+        return sparse_mat_mat_mul(mat1, mat2)
+    if isinstance(mat1, MatrixBatch):
+        return batch_mat_mat_mul(mat1, mat2)
+    if isinstance(mat1, ComplexMatrix) or isinstance(mat2, ComplexMatrix):
+        return soa_mat_mat_mul(mat1, mat2)
+    if isinstance(mat1, PackedMatrix): # general products need every entry
+        mat1 = mat1.to_matrix()
+    if isinstance(mat2, PackedMatrix):
+        mat2 = mat2.to_matrix()
     m, n = mat1.shape()
     n2, p = mat2.shape()
     if m == 0 or n == 0 or n2 == 0 or p == 0:
         raise ValueError("Matrices cannot be empty")
     if n != n2:
         raise ValueError("Inner dimensions do not match for A·B")
+    block = BLOCK_SIZE if block is None else block
+    if block < 1:
+        raise ValueError("block must be a positive integer")
+    if algorithm not in MATMUL_ALGORITHMS:
+        raise ValueError(f"algorithm must be one of {MATMUL_ALGORITHMS}")
 
-    fma = getattr(math, "fma", None)
     zero: T = mat1[0][0] - mat1[0][0]
-    result = [[None] * p for _ in range(m)]
+    real = mat1.dtype in _REAL_DTYPES and mat2.dtype in _REAL_DTYPES # dispatch once per call
+    dotk = _sumprod if real else _sumprod_generic
+    # The unrolled kernel computes each entry with the loop kernel's own dotk
+    # (one sumprod call, or the same left-to-right chain) over the single k
+    # panel, so results never depend on the call count.
+    if out is None and algorithm == "blocked" and n <= block:
+        kern = specialized("mat_mat_mul", (m, n, p), mat1.dtype,
+                           "sumprod" if dotk is _math_sumprod else "chain")
+        if kern is not None: # repeated small shape: unrolled straight-line kernel
+            return Matrix._like(kern(mat1._m, mat2._m), mat1.storage)
+
+    # Row-contiguous operands: a transposed-view B already holds Bᵀ rows (no
+    # packing), a transposed-view A is gathered into plain rows once.
+    rows1 = mat1._rows_copy() if mat1._transposed else mat1._m
+    if out is not None:
+        _check_out(out, (m, p), mat1, mat2)
+        result = out._m
+        for row in result:
+            for j in range(p):
+                row[j] = zero
+    else:
+        result = [[zero] * p for _ in range(m)]
+    if algorithm == "strassen":
+        crossover = STRASSEN_CROSSOVER if crossover is None else crossover
+        if crossover < 1:
+            raise ValueError("crossover must be a positive integer")
+        C = _strassen(mat1._rows_copy(), mat2._rows_copy(), crossover, block, dotk, zero)
+        for row, vals in zip(result, C):
+            for j, x in enumerate(vals):
+                row[j] = x
+    elif real and "float" in (mat1.dtype, mat2.dtype) and worth_parallel(m * n * p, processes):
+        flat = parallel_mat_mat_mul(rows1, mat2._columns(), m, n, p, block, dotk, processes)
+        for i, row in enumerate(result): # element by element: out= rows may be run proxies
+            for j, x in enumerate(flat[i * p:(i + 1) * p]):
+                row[j] = x
+    elif _is_adjoint_pair(mat1, mat2): # AᴴA / AAᴴ: Hermitian, only j ≥ i is computed
+        cols2 = mat2._columns()
+        def fill(bounds: tuple[int, int]) -> None:
+            _hermitian_rows(rows1, cols2, result, range(*bounds), n, block, dotk)
+
+        with thread_map(threads) as run:
+            run(fill, m, m * n * m // 2)
+        for i in range(m):
+            row = result[i]
+            for j in range(i + 1, m):
+                result[j][i] = row[j] if real else row[j].conjugate()
+    else:
+        cols2 = mat2._columns()
+        def fill(bounds: tuple[int, int]) -> None:
+            i0, i1 = bounds
+            _mat_mat_mul_blocked(rows1[i0:i1], cols2, result[i0:i1], i1 - i0, n, p, block, dotk)
 
-    # No column cache for no extra memory, just indexed access.
-    for i, rowA in enumerate(mat1._m):
-        for j in range(p):
-            if fma is not None and all(isinstance(x, float) for x in (*rowA, *(mat2._m[k][j] for k in range(n)))):
-                acc = 0.0
-                for k, a in enumerate(rowA):
-                    acc = fma(a, mat2._m[k][j], acc)
-            else:
-                acc = zero
-                for k, a in enumerate(rowA):
-                    acc += a * mat2._m[k][j]
-            result[i][j] = acc
+        with thread_map(threads) as run:
+            run(fill, m, m * n * p)
+
+    if out is not None:
+        out._touch()
+        return out
+    return Matrix._like(result, mat1.storage)
+
+
+def _chain_order(dims: List[int]) -> List[List[int]]:
+    """split[i][j] = k: the cheapest plan for operands i..j is (i..k)·(k+1..j).
+
+    Classic O(N³) dynamic programming on the scalar multiplication count
+    dims[i]·dims[k+1]·dims[j+1]; operand i is dims[i] × dims[i+1].
+    """
+    N = len(dims) - 1
+    cost = [[0] * N for _ in range(N)]
+    split = [[0] * N for _ in range(N)]
+    for length in range(2, N + 1):
+        for i in range(N - length + 1):
+            j = i + length - 1
+            cost[i][j], split[i][j] = min(
+                (cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1], k) for k in range(i, j))
+    return split
 
-    return Matrix(result)
+
+def multi_mat_mul(mats: Sequence[Matrix[T] | Vector[T]]) -> Matrix[T] | Vector[T]:
+    """Return A·B·C·… with the parenthesization that needs the fewest multiplications.
+
+    The last operand may be a Vector (a column): every sub-product that ends
+    with it is a matrix–vector product and goes through mat_vec_mul.
+
+    Time complexity: O(N^3) for the plan (N operands) + the cheapest chain cost.
+    Space complexity: O(N^2) for the plan + the intermediate products.
+    """
+    if not mats:
+        raise ValueError("multi_mat_mul needs at least one operand")
+    if any(isinstance(x, Vector) for x in mats[:-1]):
+        raise TypeError("Only the last operand may be a Vector")
+    shapes = [(len(x), 1) if isinstance(x, Vector) else x.shape() for x in mats]
+    dims = [shapes[0][0]]
+    for rows, cols in shapes:
+        if rows != dims[-1]:
+            raise ValueError("Inner dimensions do not match for A·B")
+        dims.append(cols)
+    if len(mats) == 1:
+        x = mats[0]
+        return Vector._like(x, x.storage) if isinstance(x, Vector) else x.copy()
+    split = _chain_order(dims)
+
+    def product(i: int, j: int):
+        if i == j:
+            return mats[i]
+        k = split[i][j]
+        left, right = product(i, k), product(k + 1, j)
+        return mat_vec_mul(left, right) if isinstance(right, Vector) else mat_mat_mul(left, right)
+
+    return product(0, len(mats) - 1)
+
+
+def axpy(a: T, x: Vector[T] | Matrix[T], y: Vector[T] | Matrix[T]) -> None:
+    """BLAS axpy: y ← a·x + y in place (Vectors or same-shape Matrices).
+
+    Time complexity: Θ(n) (n = number of entries)
+    Space complexity: Θ(1), nothing is allocated
+    """
+    _fit_out(y, (a, x))
+    if isinstance(y, Matrix):
+        y._check_same_shape(x)
+        for yr, xr in zip(y._m, x._m):
+            for j, xv in enumerate(xr):
+                yr[j] += a * xv
+    else:
+        y._check_same_size(x)
+        data = y._data
+        for i, xv in enumerate(x):
+            data[i] += a * xv
+    y._touch()
+
+
+def gemv(alpha: T, mat: Matrix[T], x: Vector[T], beta: T, y: Vector[T]) -> None:
+    """BLAS gemv: y ← α·A·x + β·y in place (β = 0 ignores y's old contents).
+
+    Time complexity: O(mn)
+    Space complexity: Θ(1), nothing is allocated
+    """
+    m, n = mat.shape()
+    if len(x) != n:
+        raise ValueError("Dimension mismatch in matrix–vector product")
+    _check_out(y, (m,), mat, x, alpha, beta)
+    real = mat.dtype in _REAL_DTYPES and x.dtype in _REAL_DTYPES
+    dotk = _sumprod if real else _sumprod_generic
+    data = y._data
+    for i, row in enumerate(mat._m):
+        acc = alpha * dotk(row, x)
+        data[i] = acc if beta == 0 else acc + beta * data[i]
+    y._touch()
+
+
+def gemm(alpha: T, mat1: Matrix[T], mat2: Matrix[T], beta: T, out: Matrix[T],
+         block: int | None = None) -> None:
+    """BLAS gemm: C ← α·A·B + β·C in place on `out` (β = 0 ignores C's old contents).
+
+    Runs the blocked mat_mat_mul kernel accumulating straight into C's rows.
+    Allocation-free only in part: B's columns are still gathered once per call
+    (Θ(np)) unless B is a transposed view (pass Bᵀ's storage as
+    Bt.transpose_view()), and A, B are sliced into panels when n > block.
+    A plain A with n ≤ block and such a B allocate nothing but O(m + p) handles.
+
+    Time complexity: O(nmp)
+    Space complexity: O(np) for B's columns (none for a transposed view),
+    O(nm + np) for the panels when n > block; no result matrix
+    """
+    m, n = mat1.shape()
+    n2, p = mat2.shape()
+    if n != n2:
+        raise ValueError("Inner dimensions do not match for A·B")
+    _check_out(out, (m, p), mat1, mat2, alpha, beta)
+    block = BLOCK_SIZE if block is None else block
+    if block < 1:
+        raise ValueError("block must be a positive integer")
+
+    zero: T = mat1[0][0] - mat1[0][0]
+    for row in out._m: # C ← β·C
+        for j in range(p):
+            row[j] = zero if beta == 0 else beta * row[j]
+    real = mat1.dtype in _REAL_DTYPES and mat2.dtype in _REAL_DTYPES
+    dotk = _sumprod if real else _sumprod_generic
+    rows1 = mat1._rows_copy() if mat1._transposed else mat1._m
+    _mat_mat_mul_blocked(rows1, mat2._columns(), out._m, m, n, p, block, dotk,
+                         None if alpha == 1 else alpha)
+    out._touch()
+
+
+def syrk(alpha: T, mat: Matrix[T], beta: T, out: PackedMatrix[T] | Matrix[T],
+         trans: bool = False) -> None:
+    """BLAS syrk: C ← α·A·Aᵀ + β·C (α·Aᵀ·A with trans=True) in place on `out`.
+
+    C is symmetric, so only its lower triangle is computed: n(n+1)/2 dot
+    products instead of the n² of gemm. A symmetric PackedMatrix `out` stores
+    exactly that half; a dense Matrix `out` reads its lower triangle and gets
+    the result mirrored into the upper one.
+
+    Time complexity  : O(n²k / 2) for A of shape n×k (k×n with trans=True)
+    Space complexity : O(nk) for the packed columns when trans=True, no result matrix
+    """
+    real = mat.dtype in _REAL_DTYPES
+    dotk = _sumprod if real else _sumprod_generic
+    if trans:
+        rows = mat._columns()
+    else:
+        rows = mat._rows_copy() if mat._transposed else mat._m
+    n = len(rows)
+    if isinstance(out, PackedMatrix):
+        packed_syrk(alpha, rows, beta, out, dotk)
+        return
+    _check_out(out, (n, n), mat, alpha, beta)
+    zero: T = mat[0][0] - mat[0][0]
+    C = out._m
+    for i, ri in enumerate(rows):
+        for j in range(i + 1):
+            v = dotk(ri, rows[j])
+            if alpha != 1:
+                v = alpha * v
+            C[i][j] = C[j][i] = v + zero if beta == 0 else v + beta * C[i][j]
+    out._touch()
 
 
 def trace(mat: Matrix[T]) -> T:
@@ -255,6 +740,10 @@ def trace(mat: Matrix[T]) -> T:
     Time complexity: Θ(n), where n is the number of rows (or columns).
     Space complexity: Θ(1) extra space.
     """
+    if isinstance(mat, SparseMatrix):
+        return sparse_trace(mat)
+    if isinstance(mat, PackedMatrix):
+        return packed_trace(mat)
     if not mat.is_square():
         raise ValueError("Matrix must be square")
 
@@ -269,17 +758,35 @@ def trace(mat: Matrix[T]) -> T:
     return acc
 
 
-def transpose(mat: Matrix[T]) -> Matrix[T]:
-    """Return the transpose matrix B = Aᵀ.
+def transpose(mat: Matrix[T], view: bool = False, out: Matrix[T] | None = None) -> Matrix[T]:
+    """Return the transpose matrix B = Aᵀ (written into `out` if given).
+
+    view=True returns a zero-copy view sharing mat's storage (strides
+    swapped, O(n) row handles); call .copy() on it to materialize.
 
     Time complexity: Θ(n·m) (one assignment per entry)
     Space complexity: Θ(n·m) (the returned matrix)
     """
+    if isinstance(mat, SparseMatrix):
+        return sparse_transpose(mat)
+    if isinstance(mat, PackedMatrix): # flag flip, nothing copied
+        return packed_transpose(mat)
+    if view:
+        return mat.transpose_view()
     rows, cols = mat.shape()
 
+    if out is not None:
+        _check_out(out, (cols, rows), mat)
+        dest = out._m
+        for r, row in enumerate(mat._m):
+            for c, x in enumerate(row):
+                dest[c][r] = x
+        out._touch()
+        return out
+
     data_t = [[mat[r, c] for r in range(rows)] for c in range(cols)]
 
-    return Matrix(data_t)
+    return Matrix._like(data_t, mat.storage)
 
 
 def _is_zero(x: T) -> bool:
@@ -289,160 +796,853 @@ def _is_zero(x: T) -> bool:
         return x == 0
 
 
-def row_echelon(mat: Matrix[T]) -> Matrix[T]:
-    """
-    Return the reduced row‑echelon of the matrix.
+# Exact engine (int / Fraction): Bareiss fraction-free elimination
+EXACT_DTYPES = ("int", "Fraction") # element-type tags routed to the Bareiss engine
 
-    Time complexity is O(m * n^2), where m is the number of rows and n is the number of columns.
-    Memory complexity is O(m * n) for the output matrix.
+
+def _integer_rows(mat: Matrix[T]) -> tuple[List[List[int]], int]:
+    """Return mat as integer rows plus the product of the row scales applied.
+
+    Each Fraction row is multiplied by the lcm of its denominators; int rows
+    are copied with scale 1.
     """
-    m, n = mat.shape()
+    rows = mat._rows_copy()
+    if mat.dtype == "int":
+        return rows, 1
+    scale = 1
+    out = []
+    for row in rows:
+        l = math.lcm(*(x.denominator for x in row))
+        out.append([x.numerator * (l // x.denominator) for x in row])
+        scale *= l
+    return out, scale
+
 
-    # Deep copy
-    A = [[mat[r, c] for c in range(n)] for r in range(m)]
+def _bareiss(A: List[List[int]], m: int, n: int) -> tuple[List[int], int]:
+    """Fraction-free (Bareiss) forward elimination, in place on integer rows.
 
-    pivot_row = 0
+    Every intermediate entry is a minor of the input, so sizes stay bounded by
+    Hadamard's bound instead of blowing up. Returns (pivot columns, sign of
+    the row permutation); the last pivot of a full-rank square matrix is det.
+
+    Time complexity: O(m·n·min(m, n)) integer operations.
+    """
+    pivots: List[int] = []
+    sign = 1
+    prev = 1 # previous pivot, exact divisor of the next step
+    row = 0
     for col in range(n):
-        # pivot search (first non‑zero at/below current row)
-        pivot = next((r for r in range(pivot_row, m) if not _is_zero(A[r][col])), None)
-        if pivot is None:
+        if row == m:
+            break
+        p = next((r for r in range(row, m) if A[r][col] != 0), None)
+        if p is None:
             continue # full column of zeros: skip
+        if p != row:
+            A[row], A[p] = A[p], A[row]
+            sign = -sign
+        pivot_row = A[row]
+        piv = pivot_row[col]
+        tail = pivot_row[col + 1:]
+        for r in range(row + 1, m):
+            Ar = A[r]
+            f = Ar[col]
+            Ar[col + 1:] = [(piv * x - f * y) // prev for x, y in zip(Ar[col + 1:], tail)]
+            Ar[col] = 0
+        prev = piv
+        pivots.append(col)
+        row += 1
+    return pivots, sign
+
+
+def _determinant_exact(mat: Matrix[T]) -> T:
+    """Exact det for int (→ int) and Fraction (→ Fraction) matrices."""
+    n = mat.shape()[0]
+    A, scale = _integer_rows(mat)
+    pivots, sign = _bareiss(A, n, n)
+    det = sign * A[n - 1][n - 1] if len(pivots) == n else 0
+    return det if mat.dtype == "int" else Fraction(det, scale)
+
+
+def _row_echelon_exact(mat: Matrix[T]) -> Matrix[T]:
+    """Exact reduced row-echelon form without fraction arithmetic in the loops.
+
+    Bareiss forward pass, then fraction-free back elimination with row gcd
+    reduction; only the final normalization produces Fractions (kept as int
+    when integral).
+    """
+    m, n = mat.shape()
+    A, _ = _integer_rows(mat)
+    pivots, _ = _bareiss(A, m, n)
+
+    for k in range(len(pivots) - 1, -1, -1):
+        pc = pivots[k]
+        Ak = A[k]
+        pk = Ak[pc]
+        for i in range(k):
+            f = A[i][pc]
+            if f == 0:
+                continue
+            row = [pk * x - f * y for x, y in zip(A[i], Ak)]
+            g = math.gcd(*row)
+            A[i] = [x // g for x in row] if g > 1 else row
 
-        # move pivot row up if needed
-        if pivot != pivot_row:
-            A[pivot_row], A[pivot] = A[pivot], A[pivot_row]
+    as_int = mat.dtype == "int"
+    out = []
+    for i, row in enumerate(A):
+        if i < len(pivots):
+            pv = row[pivots[i]]
+            row = [Fraction(x, pv) for x in row]
+            if as_int:
+                row = [int(x) if x.denominator == 1 else x for x in row]
+        elif not as_int:
+            row = [Fraction(x) for x in row]
+        out.append(row)
+    return Matrix._like(out, mat.storage)
+
+
+# Modular engine: elimination in GF(p) for word-sized primes, rebuilt by CRT
+_PRIME_START = (1 << 31) - 1 # primes are taken downward from here
+_PRIMES: List[int] = [] # cache of word-sized primes, largest first
+
+
+def _is_prime(n: int) -> bool:
+    """Deterministic Miller–Rabin for n < 2^32 (bases 2, 7, 61)."""
+    if n < 2:
+        return False
+    for p in (2, 3, 5, 7, 61):
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in (2, 7, 61):
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
 
-        # scale pivot row so leading entry is exactly 1
-        pv = A[pivot_row][col]
-        A[pivot_row] = [x / pv for x in A[pivot_row]]
 
-        # eliminate ALL other rows
-        for r in range(m):
-            if r == pivot_row:
-                continue
-            factor = A[r][col]
-            if _is_zero(factor):
-                continue
-            A[r] = [x - factor * y for x, y in zip(A[r], A[pivot_row])]
+def _word_primes(count: int) -> List[int]:
+    """Return the `count` largest primes below 2^31 (cached)."""
+    candidate = _PRIMES[-1] - 2 if _PRIMES else _PRIME_START
+    while len(_PRIMES) < count:
+        if _is_prime(candidate):
+            _PRIMES.append(candidate)
+        candidate -= 2
+    return _PRIMES[:count]
+
 
-        pivot_row += 1
-        if pivot_row == m:
+def _eliminate_mod_p(rows: List[List[int]], p: int) -> tuple[int, int]:
+    """Gaussian elimination over GF(p) on a copy; return (det mod p, rank mod p).
+
+    det mod p is only meaningful for square inputs (0 when rank deficient).
+    """
+    A = [[x % p for x in row] for row in rows]
+    m, n = len(A), len(A[0])
+    det = 1
+    row = 0
+    for col in range(n):
+        if row == m:
             break
+        piv = next((r for r in range(row, m) if A[r][col]), None)
+        if piv is None:
+            det = 0
+            continue
+        if piv != row:
+            A[row], A[piv] = A[piv], A[row]
+            det = -det
+        pivot_row = A[row]
+        pv = pivot_row[col]
+        det = det * pv % p
+        inv = pow(pv, -1, p)
+        tail = pivot_row[col + 1:]
+        for r in range(row + 1, m):
+            Ar = A[r]
+            f = Ar[col] * inv % p
+            if f:
+                Ar[col + 1:] = [(x - f * y) % p for x, y in zip(Ar[col + 1:], tail)]
+            Ar[col] = 0
+        row += 1
+    if row < m and m == n:
+        det = 0
+    return det % p, row
+
+
+_worker_rows: List[List[int]] = [] # operand shipped once per worker process
+
+
+def _init_modular_worker(rows: List[List[int]]) -> None:
+    global _worker_rows
+    _worker_rows = rows
+
+
+def _eliminate_mod_p_worker(p: int) -> tuple[int, int]:
+    return _eliminate_mod_p(_worker_rows, p)
+
+
+def _map_primes(rows: List[List[int]], primes: List[int], processes: int | None) -> List[tuple[int, int]]:
+    """Run _eliminate_mod_p for every prime, across processes if asked."""
+    if processes is None or processes <= 1 or len(primes) <= 1:
+        return [_eliminate_mod_p(rows, p) for p in primes]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers = processes, initializer = _init_modular_worker,
+                             initargs = (rows,)) as pool:
+        return list(pool.map(_eliminate_mod_p_worker, primes))
+
+
+def _hadamard_bits(rows: List[List[int]]) -> float:
+    """log2 of prod(max(1, ‖row‖₂)): bounds |det| and every minor of rows."""
+    return sum(math.log2(max(1, sum(x * x for x in row))) / 2 for row in rows)
+
+
+def _primes_for_bits(bits: float) -> List[int]:
+    """Smallest prefix of _word_primes whose product exceeds 2^bits."""
+    count, acc = 0, 0.0
+    while acc <= bits:
+        count += 1
+        acc += math.log2(_word_primes(count)[-1])
+    return _word_primes(count)
+
+
+def _modular_rows(mat: Matrix[T]) -> tuple[List[List[int]], int]:
+    if isinstance(mat, PackedMatrix):
+        mat = mat.to_matrix()
+    if mat.dtype not in EXACT_DTYPES:
+        raise TypeError("modular methods require int or Fraction matrices")
+    return _integer_rows(mat)
+
+
+def determinant_modular(mat: Matrix[T], processes: int | None = None) -> T:
+    """Exact det of an int / Fraction matrix via det mod p for word-sized primes + CRT.
+
+    Enough primes are used for their product to exceed twice the Hadamard
+    bound, so the symmetric residue is the true determinant. Each prime is
+    an independent GF(p) elimination on small ints; processes > 1 spreads
+    them over a process pool.
+
+    Time complexity: O(k·n^3) word-sized operations, k = number of primes.
+    Space complexity: O(n^2) per prime.
+    """
+    n_rows, n_cols = mat.shape()
+    if n_rows != n_cols:
+        raise ValueError("Determinant is defined only for square matrices")
+    rows, scale = _modular_rows(mat)
+    primes = _primes_for_bits(_hadamard_bits(rows) + 1)
 
-    return Matrix(A)
+    # Garner / incremental CRT
+    det, modulus = 0, 1
+    for p, (residue, _) in zip(primes, _map_primes(rows, primes, processes)):
+        t = (residue - det) * pow(modulus, -1, p) % p
+        det += modulus * t
+        modulus *= p
+    if det > modulus // 2:
+        det -= modulus # symmetric range
+    return det if mat.dtype == "int" else Fraction(det, scale)
 
 
-def determinant(mat: Matrix[T]) -> T:
-    """Return det(mat) via Gaussian elimination with partial pivoting (make matrix upper triangular).
+def rank_modular(mat: Matrix[T], processes: int | None = None) -> int:
+    """Exact rank of an int / Fraction matrix as the max of its ranks over GF(p).
 
-    Time complexity is O(n^3) for an n×n matrix.
-    Memory complexity is O(n^2) for the matrix copy.
+    rank over GF(p) only drops when p divides every maximal non-zero minor;
+    primes whose product exceeds the Hadamard bound of all minors cannot all
+    do so, so the max is exact. Serial runs stop at the first full rank.
+
+    Time complexity: O(k·m·n·min(m, n)) word-sized operations.
+    """
+    m, n = mat.shape()
+    rows, _ = _modular_rows(mat)
+    primes = _primes_for_bits(_hadamard_bits(rows))
+    if processes is not None and processes > 1:
+        return max(r for _, r in _map_primes(rows, primes, processes))
+    best = 0
+    for p in primes:
+        best = max(best, _eliminate_mod_p(rows, p)[1])
+        if best == min(m, n):
+            break
+    return best
+
+
+def is_hermitian(mat: Matrix[T], tol: float = 0.0) -> bool:
+    """Return True if mat equals its conjugate transpose (symmetric when real).
+
+    Entries must match exactly unless a tolerance is given: with tol > 0,
+    pairs with |A[i][j] − conj(A[j][i])| ≤ tol count as equal. Stops at the
+    first mismatch.
+    Time complexity: O(n^2) worst case, Space complexity: O(1).
     """
     n_rows, n_cols = mat.shape()
     if n_rows != n_cols:
-        raise ValueError("Determinant is defined only for square matrices")
-    n = n_rows
+        return False
+    if tol < 0:
+        raise ValueError("tol must be non-negative")
+    rows = mat._m
+    real = mat.dtype in ("float", "int", "Fraction")
+    same = (lambda a, b: a == b) if tol == 0 else (lambda a, b: abs(a - b) <= tol)
+    for i in range(n_rows):
+        row = rows[i]
+        if not real and not same(row[i], row[i].conjugate()):
+            return False # diagonal must be real
+        for j in range(i + 1, n_rows):
+            x = rows[j][i]
+            if not same(row[j], x if real else x.conjugate()):
+                return False
+    return True
+
+
+# Blocked elimination: panel factorization + deferred (rank-k) trailing update
+def _apply_pivots(A: list, rows: List[int], factors: List[list], pivots: List[int], cols) -> None:
+    """A[r][c] -= f·A[p][c] for c in cols, every row r and every (f, p) in order.
+
+    Rows are independent of each other, so any split of `rows` gives the
+    same values; exactly zero factors are skipped (callers that drop tiny
+    factors record them as 0).
+    """
+    for r, fs in zip(rows, factors):
+        Ar = A[r]
+        for f, p in zip(fs, pivots):
+            if f == 0:
+                continue
+            Ap = A[p]
+            for c in cols:
+                Ar[c] -= f * Ap[c]
 
-    # Deep copy
-    A = [[mat[r, c] for c in range(n)] for r in range(n)]
 
-    det: T = 1 # multiplicative identity of generic type T
-    sign = 1 # track row swaps
-    zero: T = mat[0][0] - mat[0][0]  # zero of generic type T
+@contextmanager
+def _trailing_workers(A: list, n: int, dtype: str, flops: int, threads: int | None,
+                      processes: int | None) -> Iterator[tuple[list, Callable]]:
+    """Yield (rows, update) for a blocked elimination over the row lists A.
 
-    for col in range(n):
-        # Partial pivot: find row with largest |pivot|
-        pivot_row = max(range(col, n), key=lambda r: abs(A[r][col]))
-        pivot_val = A[pivot_row][col]
+    update(rows, factors, pivots, cols) is _apply_pivots on those row
+    positions, split over a process pool (float rows moved into shared
+    memory; the yielded rows are then memoryviews, swapped like lists) or
+    over free-threaded threads, else run inline.
+    """
+    if dtype == "float" and worth_parallel(flops, processes):
+        with shared_rows(A, n, processes) as (views, run_tasks):
+            physical = {id(v): i for i, v in enumerate(views)}
+            rows = list(views)
+            def update(targets: List[int], factors: List[list], pivots: List[int], cols) -> None:
+                piv = [physical[id(rows[p])] for p in pivots]
+                run_tasks(_apply_pivots, [([physical[id(rows[r])] for r in targets[i0:i1]], factors[i0:i1], piv, cols)
+                                          for i0, i1 in row_chunks(len(targets), processes)])
+            yield rows, update
+        return
+    with thread_map(threads) as run:
+        def update(targets: List[int], factors: List[list], pivots: List[int], cols) -> None:
+            run(lambda b: _apply_pivots(A, targets[b[0]:b[1]], factors[b[0]:b[1]], pivots, cols),
+                len(targets), len(targets) * len(pivots) * len(cols))
+        yield A, update
+
+
+def row_echelon(mat: Matrix[T], threads: int | None = None, processes: int | None = None) -> Matrix[T]:
+    """
+    Return the reduced row‑echelon of the matrix.
+    int / Fraction matrices take the exact Bareiss path (no float rounding).
 
-        # If pivot is ‘zero’, determinant is zero
-        try:
-            is_zero = abs(pivot_val) < _EPS
-        except TypeError:  # non-float
-            is_zero = pivot_val == 0
-        if is_zero:
-            return det * zero  # correct zero of type T
+    Gauss–Jordan by panels of PANEL_SIZE columns: the panel is reduced first,
+    the recorded pivot factors are then applied to every other column in one
+    pass per row (same operations, same order, same result as column by
+    column). That pass is split over `threads` (free-threaded builds) or
+    `processes` (float matrices, shared memory) when the job is large.
+
+    Time complexity is O(m * n^2), where m is the number of rows and n is the number of columns.
+    Memory complexity is O(m * n) for the output matrix.
+    """
+    if isinstance(mat, GF2Matrix):
+        return gf2_row_echelon(mat)
+    if isinstance(mat, PackedMatrix): # elimination fills both triangles
+        mat = mat.to_matrix()
+    if mat.dtype in EXACT_DTYPES:
+        return _row_echelon_exact(mat)
+    m, n = mat.shape()
+
+    # Deep copy (plain lists, read straight from the row storage)
+    with _trailing_workers(mat._rows_copy(), n, mat.dtype, m * n * min(m, n), threads, processes) as (A, update):
+        pivot_row = 0
+        for k0 in range(0, n, PANEL_SIZE):
+            if pivot_row == m:
+                break
+            k1 = min(k0 + PANEL_SIZE, n)
+            panel = range(k0, k1)
+            first = pivot_row
+            scales = [] # pivot values of this panel
+            factors = [[] for _ in range(m)] # factors[r][s]: multiple of pivot s taken from row r
+            for col in panel:
+                # pivot search (first non‑zero at/below current row)
+                pivot = next((r for r in range(pivot_row, m) if not _is_zero(A[r][col])), None)
+                if pivot is None:
+                    continue # full column of zeros: skip
+
+                # move pivot row up if needed
+                if pivot != pivot_row:
+                    A[pivot_row], A[pivot] = A[pivot], A[pivot_row]
+                    factors[pivot_row], factors[pivot] = factors[pivot], factors[pivot_row]
+
+                # scale pivot row so leading entry is exactly 1
+                pv = A[pivot_row][col]
+                P = A[pivot_row]
+                for c in panel:
+                    P[c] /= pv
+                scales.append(pv)
+                factors[pivot_row].append(0) # own step: a division, not an update
+
+                # eliminate ALL other rows (panel columns now, the rest below)
+                for r in range(m):
+                    if r == pivot_row:
+                        continue
+                    factor = A[r][col]
+                    if _is_zero(factor): # negligible entry: no update, here or outside the panel
+                        factors[r].append(0)
+                        continue
+                    factors[r].append(factor)
+                    Ar = A[r]
+                    for c in panel:
+                        Ar[c] -= factor * P[c]
+
+                pivot_row += 1
+                if pivot_row == m:
+                    break
+
+            # Same updates on the columns outside the panel. Pivot rows first
+            # take their earlier steps and their scaling, every other row then
+            # sees each pivot row as it was at its own step, and only after
+            # that do pivot rows take the later steps (elimination above).
+            steps = list(range(first, pivot_row))
+            if not steps:
+                continue
+            cols = [c for c in range(n) if not k0 <= c < k1]
+            for s, p in enumerate(steps):
+                _apply_pivots(A, [p], [factors[p][:s]], steps[:s], cols)
+                P, pv = A[p], scales[s]
+                for c in cols:
+                    P[c] /= pv
+            others = [r for r in range(m) if not first <= r < pivot_row]
+            update(others, [factors[r] for r in others], steps, cols)
+            for s, p in enumerate(steps):
+                _apply_pivots(A, [p], [factors[p][s + 1:]], steps[s + 1:], cols)
+
+        A = [list(row) for row in A]
+    return Matrix._like(A, mat.storage)
+
+
+class LU(Generic[T]):
+    """PA = LU factorization with partial pivoting, computed once and reused.
+
+    L (unit lower) and U (upper, row-echelon when singular) are packed in one
+    m×n working copy; perm[i] is the original row that ended up in row i.
+    Columns are factored by panels of PANEL_SIZE and the rest of the matrix
+    is updated once per panel (right-looking, same operations and order as
+    column by column). That update is split over `threads` (free-threaded
+    builds) or `processes` (float matrices, shared memory) when large.
+    """
+
+    def __init__(self, mat: Matrix[T], threads: int | None = None, processes: int | None = None) -> None:
+        if isinstance(mat, PackedMatrix): # L\U fills both triangles
+            mat = mat.to_matrix()
+        m, n = mat.shape()
+        A = mat._rows_copy()
+        perm = list(range(m))
+        sign = 1
+        pivots: List[int] = [] # pivot column of each U row
+        zero: T = mat[0][0] - mat[0][0]
+
+        with _trailing_workers(A, n, mat.dtype, m * n * min(m, n), threads, processes) as (A, update):
+            row = 0
+            for k0 in range(0, n, PANEL_SIZE):
+                if row == m:
+                    break
+                k1 = min(k0 + PANEL_SIZE, n)
+                first = row
+                for col in range(k0, k1):
+                    if row == m:
+                        break
+                    # Partial pivot: largest |a| at/below the current row
+                    p = max(range(row, m), key = lambda r: abs(A[r][col]))
+                    pivot_val = A[p][col]
+                    if _is_zero(pivot_val):
+                        continue # no pivot in this column: rank deficient
+                    if p != row:
+                        A[row], A[p] = A[p], A[row]
+                        perm[row], perm[p] = perm[p], perm[row]
+                        sign = -sign
+
+                    # Store multipliers under the pivot, update the rest of the panel
+                    pivot_row = A[row]
+                    for r in range(row + 1, m):
+                        Ar = A[r]
+                        factor = Ar[col] / pivot_val
+                        Ar[col] = factor
+                        if factor == 0: # only exact zeros: the tolerance is for pivots
+                            continue
+                        for c in range(col + 1, k1):
+                            Ar[c] -= factor * pivot_row[c]
+                    pivots.append(col)
+                    row += 1
+
+                # Deferred update of columns k1.. with the panel's multipliers:
+                # U rows of the panel first (each needs the earlier ones), then
+                # the trailing rows, all independent of each other.
+                if k1 == n or row == first:
+                    continue
+                steps = list(range(first, row))
+                panel_cols = pivots[len(pivots) - len(steps):]
+                cols = range(k1, n)
+                for s, r in enumerate(steps):
+                    _apply_pivots(A, [r], [[A[r][c] for c in panel_cols[:s]]], steps[:s], cols)
+                below = list(range(row, m))
+                update(below, [[A[r][c] for c in panel_cols] for r in below], steps, cols)
+
+            A = [list(r) for r in A]
+
+        self._lu = A
+        self._perm = perm
+        self._sign = sign
+        self._pivots = pivots
+        self._shape = (m, n)
+        self._zero = zero
+        self._storage = mat.storage
+        self._det: T | None = None
+
+    @property
+    def perm(self) -> List[int]:
+        return list(self._perm)
+
+    def rank(self) -> int:
+        """Number of pivots. O(1)."""
+        return len(self._pivots)
+
+    def _check_invertible(self) -> int:
+        m, n = self._shape
+        if m != n:
+            raise ValueError("Matrix must be square")
+        if len(self._pivots) != n:
+            raise ValueError("Matrix is singular (zero pivot)")
+        return n
+
+    def det(self) -> T:
+        """Product of U's diagonal times the permutation sign. O(n)."""
+        m, n = self._shape
+        if m != n:
+            raise ValueError("Determinant is defined only for square matrices")
+        if self._det is None:
+            if len(self._pivots) != n:
+                self._det = self._zero # correct zero of type T
+            else:
+                det: T = 1 # multiplicative identity of generic type T
+                for i in range(n):
+                    det *= self._lu[i][i]
+                self._det = det * self._sign
+        return self._det
+
+    def _solve_rows(self, B: List[list]) -> List[list]:
+        """Solve A·X = B in place on B given as n rows of k right-hand sides.
+
+        Time complexity: O(n²k) (forward then back substitution).
+        """
+        n = self._check_invertible()
+        LU_ = self._lu
+        X = [B[self._perm[i]][:] for i in range(n)] # apply P
+        # Forward: L·Y = P·B (L has a unit diagonal)
+        for i in range(1, n):
+            Li, Xi = LU_[i], X[i]
+            for j in range(i):
+                f = Li[j]
+                if f == 0:
+                    continue
+                Xj = X[j]
+                for c in range(len(Xi)):
+                    Xi[c] -= f * Xj[c]
+        # Back: U·X = Y
+        for i in range(n - 1, -1, -1):
+            Ui, Xi = LU_[i], X[i]
+            for j in range(i + 1, n):
+                f = Ui[j]
+                if f == 0:
+                    continue
+                Xj = X[j]
+                for c in range(len(Xi)):
+                    Xi[c] -= f * Xj[c]
+            d = Ui[i]
+            X[i] = [x / d for x in Xi]
+        return X
+
+    def solve(self, b: Vector[T] | Matrix[T]) -> Vector[T] | Matrix[T]:
+        """Solve A·x = b (Vector) or A·X = B (Matrix of right-hand sides)."""
+        n = self._check_invertible()
+        if isinstance(b, Vector):
+            if len(b) != n:
+                raise ValueError("Dimension mismatch in solve")
+            X = self._solve_rows([[x] for x in b])
+            return Vector._like([row[0] for row in X], b.storage)
+        if b.shape()[0] != n:
+            raise ValueError("Dimension mismatch in solve")
+        return Matrix._like(self._solve_rows(b._rows_copy()), b.storage)
+
+    def inverse(self) -> Matrix[T]:
+        """Solve A·X = I column block at once. O(n³), no augmented matrix."""
+        n = self._check_invertible()
+        zero = self._zero
+        I = [[zero] * n for _ in range(n)]  # zero matrix of type T
+        for i in range(n):
+            I[i][i] = zero + 1
+        return Matrix._like(self._solve_rows(I), self._storage)
+
+
+def lu(mat: Matrix[T], threads: int | None = None, processes: int | None = None) -> LU[T]:
+    """Factor mat once; det(), inverse(), solve() and rank() then reuse it.
+
+    Time complexity: O(m·n·min(m, n)) for the factorization.
+    Space complexity: O(m·n) for the packed L\\U copy.
+    """
+    return LU(mat, threads, processes)
 
-        # Row swap if needed
-        if pivot_row != col:
-            A[col], A[pivot_row] = A[pivot_row], A[col]
-            sign *= -1
 
-        # Eliminate entries below the pivot
-        for r in range(col + 1, n):
-            factor = A[r][col] / pivot_val
-            A[r][col] = zero
-            for c in range(col + 1, n):
-                A[r][c] -= factor * A[col][c]
+class Cholesky(Generic[T]):
+    """A = L·Lᴴ for a Hermitian (symmetric when real) positive-definite A.
 
-        det *= pivot_val  # The determinant of an upper triangular matrix is the product of the diagonal elements.
+    Only the lower triangle of A is read (a symmetric PackedMatrix is
+    factored straight from its packed rows); L is kept as ragged rows
+    (row i holds L[i][0..i]). No pivoting, about half the work of LU.
+    """
 
-    return det * sign
+    def __init__(self, mat: Matrix[T] | PackedMatrix[T]) -> None:
+        n_rows, n_cols = mat.shape()
+        if n_rows != n_cols:
+            raise ValueError("Cholesky factorization needs a square matrix")
+        # A packed symmetric matrix stores exactly the rows read below
+        rows = mat.lower_rows() if isinstance(mat, PackedMatrix) else mat._m
+        n = n_rows
+        real = mat.dtype in ("float", "int", "Fraction")
+        dotk = _sumprod if mat.dtype in _REAL_DTYPES else _sumprod_generic
+        L: List[list] = []
+        Lc: List[list] = [] # conjugated rows of L (the same lists when real)
+        pivots: List[float] = [] # L[i][i]², kept to form det without squaring roots
+        for i, row in enumerate(rows):
+            Li = []
+            for j in range(i + 1):
+                if j < i:
+                    s = row[j] - dotk(Li, Lc[j][:j]) if j else row[j]
+                else: # diagonal: row[i] − ‖L[i][:i]‖²
+                    s = row[i] - dotk(Li, Li if real else [x.conjugate() for x in Li]) if i else row[i]
+                if j == i:
+                    d = s if real else s.real # Hermitian: the diagonal is real
+                    if d <= _EPS:
+                        raise ValueError("Matrix is not positive definite")
+                    pivots.append(d)
+                    Li.append(math.sqrt(d))
+                else:
+                    Li.append(s / L[j][j])
+            L.append(Li)
+            Lc.append(Li if real else [x.conjugate() for x in Li])
+        self._L, self._Lc, self._pivots = L, Lc, pivots
+        self._n = n
+        self._zero = mat[0][0] - mat[0][0]
+        self._storage = mat.storage
+
+    def det(self) -> T:
+        """Product of the pivots L[i][i]² (real, positive). O(n)."""
+        d = 1.0
+        for p in self._pivots:
+            d *= p
+        return self._zero + d # same scalar type as the entries
+
+    def logdet(self) -> float:
+        """log det(A) = Σ log L[i][i]², free of overflow/underflow. O(n)."""
+        return math.fsum(map(math.log, self._pivots))
+
+    def _solve_rows(self, B: List[list]) -> List[list]:
+        """Solve L·Lᴴ·X = B in place on B given as n rows of k right-hand sides. O(n²k)."""
+        n, L, Lc = self._n, self._L, self._Lc
+        X = [row[:] for row in B]
+        # Forward: L·Y = B
+        for i in range(n):
+            Li, Xi = L[i], X[i]
+            for j in range(i):
+                f = Li[j]
+                if f == 0:
+                    continue
+                Xj = X[j]
+                for c in range(len(Xi)):
+                    Xi[c] -= f * Xj[c]
+            d = Li[i]
+            X[i] = [x / d for x in Xi]
+        # Back: Lᴴ·X = Y, row i of Lᴴ is column i of L conjugated
+        for i in range(n - 1, -1, -1):
+            Xi = X[i]
+            for j in range(i + 1, n):
+                f = Lc[j][i]
+                if f == 0:
+                    continue
+                Xj = X[j]
+                for c in range(len(Xi)):
+                    Xi[c] -= f * Xj[c]
+            d = L[i][i]
+            X[i] = [x / d for x in Xi]
+        return X
+
+    def solve(self, b: Vector[T] | Matrix[T]) -> Vector[T] | Matrix[T]:
+        """Solve A·x = b (Vector) or A·X = B (Matrix of right-hand sides)."""
+        n = self._n
+        if isinstance(b, Vector):
+            if len(b) != n:
+                raise ValueError("Dimension mismatch in solve")
+            X = self._solve_rows([[x] for x in b])
+            return Vector._like([row[0] for row in X], b.storage)
+        if b.shape()[0] != n:
+            raise ValueError("Dimension mismatch in solve")
+        return Matrix._like(self._solve_rows(b._rows_copy()), b.storage)
+
+    def inverse(self) -> Matrix[T]:
+        """A⁻¹ from n right-hand sides of the identity. O(n³)."""
+        n, zero = self._n, self._zero
+        I = [[zero] * n for _ in range(n)]  # zero matrix of type T
+        for i in range(n):
+            I[i][i] = zero + 1
+        return Matrix._like(self._solve_rows(I), self._storage)
+
+
+def cholesky(mat: Matrix[T]) -> Cholesky[T]:
+    """Factor a Hermitian positive-definite mat as L·Lᴴ (ValueError otherwise).
+
+    Time complexity: O(n^3 / 3) multiply-adds, half of LU.
+    Space complexity: O(n^2 / 2) for L.
+    """
+    return Cholesky(mat)
+
+
+def _auto_cholesky(mat: Matrix[T], hermitian: bool | None) -> Cholesky[T] | None:
+    """Cholesky factor when mat is declared (hermitian=True) or detected
+    exactly Hermitian and turns out positive definite; None means use LU.
+    Cholesky reads only the lower triangle, so detection allows no tolerance:
+    a nearly Hermitian matrix must be declared by the caller."""
+    if hermitian is False or mat.dtype in EXACT_DTYPES or mat.dtype == "mixed":
+        return None
+    if hermitian is None and not is_hermitian(mat):
+        return None
+    try:
+        return Cholesky(mat)
+    except ValueError: # indefinite or singular: LU handles it
+        return None
 
 
-def inverse(mat: Matrix[T]) -> Matrix[T]:
-    """Return the inverse of matrix.
+def _packed_cholesky(mat: PackedMatrix[T]) -> Cholesky[T] | None:
+    """Cholesky factor read from the packed rows of a float symmetric
+    positive-definite mat; None means densify and use the general path."""
+    if mat.dtype != "float":
+        return None
+    try:
+        return Cholesky(mat)
+    except ValueError: # indefinite or singular
+        return None
+
+
+def determinant(mat: Matrix[T], threads: int | None = None, processes: int | None = None,
+                hermitian: bool | None = None) -> T:
+    """Return det(mat) via Gaussian elimination with partial pivoting (make matrix upper triangular).
+    int / Fraction matrices use fraction-free Bareiss elimination and stay exact
+    (or, for a repeated n ≤ CODEGEN_MAX_DET, an unrolled cofactor expansion).
+    `threads` / `processes` are passed on to lu() (parallel trailing updates).
+    Hermitian positive-definite matrices (declared with hermitian=True, or
+    detected exactly when hermitian is None) use Cholesky instead: half the work.
+    A triangular PackedMatrix costs O(n): the product of its diagonal.
+
+    Time complexity is O(n^3) for an n×n matrix.
+    Memory complexity is O(n^2) for the matrix copy.
+    """
+    n_rows, n_cols = mat.shape()
+    if n_rows != n_cols:
+        raise ValueError("Determinant is defined only for square matrices")
+    if isinstance(mat, MatrixBatch):
+        return batch_determinant(mat)
+    if isinstance(mat, PackedMatrix):
+        if mat.kind != "symmetric":
+            return packed_determinant(mat)
+        factor = _packed_cholesky(mat)
+        if factor is not None:
+            return factor.det()
+        mat, hermitian = mat.to_matrix(), False
+    if mat.dtype in EXACT_DTYPES: # exact, so the unrolled cofactor expansion gives the same value
+        kern = specialized("determinant", (n_rows,), mat.dtype)
+        return kern(mat._m) if kern is not None else _determinant_exact(mat)
+    factor = _auto_cholesky(mat, hermitian)
+    if factor is not None:
+        return factor.det()
+    return lu(mat, threads, processes).det()
+
+
+def inverse(mat: Matrix[T], threads: int | None = None, processes: int | None = None,
+            hermitian: bool | None = None) -> Matrix[T]:
+    """Return the inverse of matrix (LU factorization, then n triangular solves).
+    `threads` / `processes` are passed on to lu() (parallel trailing updates).
+    Hermitian positive-definite matrices use Cholesky (see determinant).
+    A PackedMatrix gets a PackedMatrix of the same kind: triangular ones are
+    inverted by substitution (n^3/6 multiply-adds), symmetric ones by Cholesky.
 
     Time complexity: O(n^3) where n is the number of rows/columns in the matrix.
-    Space complexity: O(n^2) for the augmented matrix.
+    Space complexity: O(n^2) for the factorization and the result.
     """
+    if isinstance(mat, GF2Matrix):
+        return gf2_inverse(mat)
+    if isinstance(mat, MatrixBatch):
+        return batch_inverse(mat)
+    if isinstance(mat, PackedMatrix):
+        if mat.kind != "symmetric":
+            return packed_inverse(mat)
+        factor = _packed_cholesky(mat)
+        inv = factor.inverse() if factor is not None else lu(mat.to_matrix(), threads, processes).inverse()
+        return PackedMatrix.from_matrix(inv, "symmetric")
     n_rows, n_cols = mat.shape()
     if n_rows != n_cols:
         raise ValueError("Inverse exists only for square matrices")
-    n = n_rows
+    factor = _auto_cholesky(mat, hermitian)
+    if factor is not None:
+        return factor.inverse()
+    return lu(mat, threads, processes).inverse()
 
-    # Build the augmented matrix [A | I]
-    A = [[mat[r, c] for c in range(n)] for r in range(n)]
-    I = [[mat[0, 0] - mat[0, 0] for _ in range(n)] for _ in range(n)]  # zero matrix of type T
-    for i in range(n):
-        I[i][i] = I[i][i] + 1
-    aug = [A[i] + I[i] for i in range(n)]  # each row: A | I
 
-    # Gauss–Jordan elimination
-    pivot_row = 0
-    for col in range(n):
-        # pivot search
-        pivot = next((r for r in range(pivot_row, n) if not _is_zero(aug[r][col])), None)
-        if pivot is None:
-            raise ValueError("Matrix is singular (zero pivot)")
-        # swap
-        if pivot != pivot_row:
-            aug[pivot_row], aug[pivot] = aug[pivot], aug[pivot_row]
-        # scale pivot row
-        pv = aug[pivot_row][col]
-        scale = [x / pv for x in aug[pivot_row]]
-        aug[pivot_row] = scale
-        # eliminate other rows
-        for r in range(n):
-            if r == pivot_row:
-                continue
-            factor = aug[r][col]
-            if _is_zero(factor):
-                continue
-            aug[r] = [x - factor * y for x, y in zip(aug[r], aug[pivot_row])]
-        pivot_row += 1
-    # Extract inverse from right half
-    inv_data = [row[n:] for row in aug]
+def solve(mat: Matrix[T], b: Vector[T] | Matrix[T], hermitian: bool | None = None) -> Vector[T] | Matrix[T]:
+    """Solve A·x = b (Vector) or A·X = B (Matrix, one right-hand side per column).
 
-    return Matrix(inv_data)
+    Partial-pivoting LU then forward/back substitution; the inverse is never
+    formed, so this costs about a third of mat_vec_mul(inverse(A), b) and
+    rounds less. Hermitian positive-definite matrices use Cholesky (see determinant).
+    A triangular PackedMatrix needs no factorization: O(n^2·k) substitution.
 
-def _is_zero_scalar(x: T) -> bool:
-    """Zero‑test"""
-    try:
-        return abs(x) < _EPS
-    except TypeError:  # non‑abs‑supporting types (e.g. Fractions)
-        return x == 0
+    Time complexity: O(n^3 + n^2·k) for k right-hand sides.
+    Space complexity: O(n^2 + n·k) for the factorization and the result.
+    """
+    n_rows, n_cols = mat.shape()
+    if n_rows != n_cols:
+        raise ValueError("solve requires a square matrix")
+    if isinstance(mat, PackedMatrix):
+        if mat.kind != "symmetric":
+            return packed_triangular_solve(mat, b)
+        factor = _packed_cholesky(mat)
+        return factor.solve(b) if factor is not None else lu(mat.to_matrix()).solve(b)
+    factor = _auto_cholesky(mat, hermitian)
+    if factor is not None:
+        return factor.solve(b)
+    return lu(mat).solve(b)
 
 def rank(mat: Matrix[T]) -> int:
-    """Return the rank of matrix. Rank is the number of non‑zero rows in the row‑echelon form.
+    """Return the rank of matrix. Rank is the number of pivots of its LU factorization.
 
     Time complexity: O(n^3) for an n x n matrix.
     Space complexity: O(n^2) for an n x n matrix.
     """
-    ref = row_echelon(mat)
-    rows, cols = ref.shape()
-
-    def is_zero_row(r: int) -> bool:
-        return all(_is_zero_scalar(ref[r, c]) for c in range(cols))
-
-    return sum(not is_zero_row(r) for r in range(rows))
\ No newline at end of file
+    if isinstance(mat, GF2Matrix):
+        return gf2_rank(mat)
+    if isinstance(mat, PackedMatrix):
+        mat = mat.to_matrix()
+    if mat.dtype in EXACT_DTYPES:
+        m, n = mat.shape()
+        A, _ = _integer_rows(mat)
+        return len(_bareiss(A, m, n)[0])
+    return lu(mat).rank()
\ No newline at end of file
@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+from typing import Sequence, Iterable, Iterator
+from array import array
+from itertools import chain, starmap, repeat
+
+from vector import Vector
+from matrix import Matrix
+
+BATCH_SIZES = (2, 3, 4) # matrix sizes served by the unrolled kernels
+
+
+class MatrixBatch:
+    """Many same-size n×n float matrices (n in BATCH_SIZES) in one flat array('d').
+
+    Matrix k occupies buf[k·n²:(k + 1)·n²] in row-major order; batch kernels
+    walk the buffer once and call a closed-form, fully unrolled kernel per
+    matrix, with no pivot search, list copies or per-call type checks.
+    """
+
+    def __init__(self, matrices: Iterable[Matrix | Sequence[Sequence[float]]]) -> None:
+        buf = array("d")
+        n = None
+        for mat in matrices:
+            rows = mat._m if isinstance(mat, Matrix) else mat
+            size = len(rows)
+            if n is None:
+                n = size
+            if size != n or any(len(r) != n for r in rows):
+                raise ValueError("All matrices of a batch must be square and of the same size")
+            for row in rows:
+                buf.extend(row)
+        if n is None: # empty batch not allowed
+            raise ValueError("Batch cannot be empty")
+        self._init(n, buf)
+
+    def _init(self, n: int, buf: array) -> None:
+        if n not in BATCH_SIZES:
+            raise ValueError(f"Batched kernels support sizes {BATCH_SIZES}")
+        if len(buf) % (n * n):
+            raise ValueError("Buffer length is not a multiple of n²")
+        self._n = n
+        self._buf = buf
+
+    @classmethod
+    def from_flat(cls, n: int, values: Iterable[float]) -> "MatrixBatch":
+        """Wrap row-major values of consecutive n×n matrices (no per-matrix objects)."""
+        batch = cls.__new__(cls)
+        batch._init(n, values if isinstance(values, array) and values.typecode == "d"
+                    else array("d", values))
+        return batch
+
+    def __len__(self) -> int: return len(self._buf) // (self._n * self._n)
+
+    def shape(self) -> tuple[int, int]: return (self._n, self._n)
+
+    def __getitem__(self, k: int) -> Matrix[float]:
+        n = self._n
+        k = k + len(self) if k < 0 else k
+        if not 0 <= k < len(self):
+            raise IndexError("Batch index out of range")
+        flat = self._buf[k * n * n:(k + 1) * n * n]
+        return Matrix([flat[r * n:(r + 1) * n] for r in range(n)], storage = "array")
+
+    def __iter__(self) -> Iterator[Matrix[float]]:
+        return (self[k] for k in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"MatrixBatch(n={self._n}, count={len(self)})"
+
+    def _groups(self) -> Iterator[tuple]:
+        """One tuple of n² floats per matrix, straight from the buffer."""
+        return zip(*[iter(self._buf)] * (self._n * self._n))
+
+
+class VectorBatch:
+    """Many same-size float vectors (size in BATCH_SIZES) in one flat array('d')."""
+
+    def __init__(self, vectors: Iterable[Vector | Sequence[float]]) -> None:
+        buf = array("d")
+        n = None
+        for v in vectors:
+            if n is None:
+                n = len(v)
+            if len(v) != n:
+                raise ValueError("All vectors of a batch must have the same size")
+            buf.extend(v)
+        if n is None: # empty batch not allowed
+            raise ValueError("Batch cannot be empty")
+        self._init(n, buf)
+
+    def _init(self, n: int, buf: array) -> None:
+        if n not in BATCH_SIZES:
+            raise ValueError(f"Batched kernels support sizes {BATCH_SIZES}")
+        if len(buf) % n:
+            raise ValueError("Buffer length is not a multiple of n")
+        self._n = n
+        self._buf = buf
+
+    @classmethod
+    def from_flat(cls, n: int, values: Iterable[float]) -> "VectorBatch":
+        batch = cls.__new__(cls)
+        batch._init(n, values if isinstance(values, array) and values.typecode == "d"
+                    else array("d", values))
+        return batch
+
+    def __len__(self) -> int: return len(self._buf) // self._n
+
+    def __getitem__(self, k: int) -> Vector[float]:
+        n = self._n
+        k = k + len(self) if k < 0 else k
+        if not 0 <= k < len(self):
+            raise IndexError("Batch index out of range")
+        return Vector(self._buf[k * n:(k + 1) * n], storage = "array")
+
+    def __iter__(self) -> Iterator[Vector[float]]:
+        return (self[k] for k in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"VectorBatch(n={self._n}, count={len(self)})"
+
+    def _groups(self) -> Iterator[tuple]:
+        return zip(*[iter(self._buf)] * self._n)
+
+
+# Closed-form kernels: one flat row-major tuple in, one value / tuple out
+
+def _det2(a00, a01, a10, a11):
+    return a00 * a11 - a01 * a10
+
+
+def _det3(a00, a01, a02, a10, a11, a12, a20, a21, a22):
+    return (a00 * (a11 * a22 - a12 * a21)
+            - a01 * (a10 * a22 - a12 * a20)
+            + a02 * (a10 * a21 - a11 * a20))
+
+
+def _det4(a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33):
+    # Laplace expansion along the first two rows: 2×2 minors s (top) · c (bottom)
+    s0 = a00 * a11 - a10 * a01
+    s1 = a00 * a12 - a10 * a02
+    s2 = a00 * a13 - a10 * a03
+    s3 = a01 * a12 - a11 * a02
+    s4 = a01 * a13 - a11 * a03
+    s5 = a02 * a13 - a12 * a03
+    c0 = a20 * a31 - a30 * a21
+    c1 = a20 * a32 - a30 * a22
+    c2 = a20 * a33 - a30 * a23
+    c3 = a21 * a32 - a31 * a22
+    c4 = a21 * a33 - a31 * a23
+    c5 = a22 * a33 - a32 * a23
+    return s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+
+def _singular() -> None:
+    raise ValueError("Matrix is singular (zero pivot)")
+
+
+def _inv2(a00, a01, a10, a11):
+    det = a00 * a11 - a01 * a10
+    if det == 0:
+        _singular()
+    r = 1.0 / det
+    return (a11 * r, -a01 * r,
+            -a10 * r, a00 * r)
+
+
+def _inv3(a00, a01, a02, a10, a11, a12, a20, a21, a22):
+    # adjugate (transposed cofactors) / det
+    c00 = a11 * a22 - a12 * a21
+    c01 = a12 * a20 - a10 * a22
+    c02 = a10 * a21 - a11 * a20
+    det = a00 * c00 + a01 * c01 + a02 * c02
+    if det == 0:
+        _singular()
+    r = 1.0 / det
+    return (c00 * r, (a02 * a21 - a01 * a22) * r, (a01 * a12 - a02 * a11) * r,
+            c01 * r, (a00 * a22 - a02 * a20) * r, (a02 * a10 - a00 * a12) * r,
+            c02 * r, (a01 * a20 - a00 * a21) * r, (a00 * a11 - a01 * a10) * r)
+
+
+def _inv4(a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33):
+    # adjugate from the same 2×2 minors as _det4
+    s0 = a00 * a11 - a10 * a01
+    s1 = a00 * a12 - a10 * a02
+    s2 = a00 * a13 - a10 * a03
+    s3 = a01 * a12 - a11 * a02
+    s4 = a01 * a13 - a11 * a03
+    s5 = a02 * a13 - a12 * a03
+    c0 = a20 * a31 - a30 * a21
+    c1 = a20 * a32 - a30 * a22
+    c2 = a20 * a33 - a30 * a23
+    c3 = a21 * a32 - a31 * a22
+    c4 = a21 * a33 - a31 * a23
+    c5 = a22 * a33 - a32 * a23
+    det = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+    if det == 0:
+        _singular()
+    r = 1.0 / det
+    return (( a11 * c5 - a12 * c4 + a13 * c3) * r,
+            (-a01 * c5 + a02 * c4 - a03 * c3) * r,
+            ( a31 * s5 - a32 * s4 + a33 * s3) * r,
+            (-a21 * s5 + a22 * s4 - a23 * s3) * r,
+            (-a10 * c5 + a12 * c2 - a13 * c1) * r,
+            ( a00 * c5 - a02 * c2 + a03 * c1) * r,
+            (-a30 * s5 + a32 * s2 - a33 * s1) * r,
+            ( a20 * s5 - a22 * s2 + a23 * s1) * r,
+            ( a10 * c4 - a11 * c2 + a13 * c0) * r,
+            (-a00 * c4 + a01 * c2 - a03 * c0) * r,
+            ( a30 * s4 - a31 * s2 + a33 * s0) * r,
+            (-a20 * s4 + a21 * s2 - a23 * s0) * r,
+            (-a10 * c3 + a11 * c1 - a12 * c0) * r,
+            ( a00 * c3 - a01 * c1 + a02 * c0) * r,
+            (-a30 * s3 + a31 * s1 - a32 * s0) * r,
+            ( a20 * s3 - a21 * s1 + a22 * s0) * r)
+
+
+def _mv2(a, v):
+    a00, a01, a10, a11 = a
+    v0, v1 = v
+    return (a00 * v0 + a01 * v1,
+            a10 * v0 + a11 * v1)
+
+
+def _mm2(a, b):
+    a00, a01, a10, a11 = a
+    b00, b01, b10, b11 = b
+    return (a00 * b00 + a01 * b10,
+            a00 * b01 + a01 * b11,
+            a10 * b00 + a11 * b10,
+            a10 * b01 + a11 * b11)
+
+
+def _mv3(a, v):
+    a00, a01, a02, a10, a11, a12, a20, a21, a22 = a
+    v0, v1, v2 = v
+    return (a00 * v0 + a01 * v1 + a02 * v2,
+            a10 * v0 + a11 * v1 + a12 * v2,
+            a20 * v0 + a21 * v1 + a22 * v2)
+
+
+def _mm3(a, b):
+    a00, a01, a02, a10, a11, a12, a20, a21, a22 = a
+    b00, b01, b02, b10, b11, b12, b20, b21, b22 = b
+    return (a00 * b00 + a01 * b10 + a02 * b20,
+            a00 * b01 + a01 * b11 + a02 * b21,
+            a00 * b02 + a01 * b12 + a02 * b22,
+            a10 * b00 + a11 * b10 + a12 * b20,
+            a10 * b01 + a11 * b11 + a12 * b21,
+            a10 * b02 + a11 * b12 + a12 * b22,
+            a20 * b00 + a21 * b10 + a22 * b20,
+            a20 * b01 + a21 * b11 + a22 * b21,
+            a20 * b02 + a21 * b12 + a22 * b22)
+
+
+def _mv4(a, v):
+    a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = a
+    v0, v1, v2, v3 = v
+    return (a00 * v0 + a01 * v1 + a02 * v2 + a03 * v3,
+            a10 * v0 + a11 * v1 + a12 * v2 + a13 * v3,
+            a20 * v0 + a21 * v1 + a22 * v2 + a23 * v3,
+            a30 * v0 + a31 * v1 + a32 * v2 + a33 * v3)
+
+
+def _mm4(a, b):
+    a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = a
+    b00, b01, b02, b03, b10, b11, b12, b13, b20, b21, b22, b23, b30, b31, b32, b33 = b
+    return (a00 * b00 + a01 * b10 + a02 * b20 + a03 * b30,
+            a00 * b01 + a01 * b11 + a02 * b21 + a03 * b31,
+            a00 * b02 + a01 * b12 + a02 * b22 + a03 * b32,
+            a00 * b03 + a01 * b13 + a02 * b23 + a03 * b33,
+            a10 * b00 + a11 * b10 + a12 * b20 + a13 * b30,
+            a10 * b01 + a11 * b11 + a12 * b21 + a13 * b31,
+            a10 * b02 + a11 * b12 + a12 * b22 + a13 * b32,
+            a10 * b03 + a11 * b13 + a12 * b23 + a13 * b33,
+            a20 * b00 + a21 * b10 + a22 * b20 + a23 * b30,
+            a20 * b01 + a21 * b11 + a22 * b21 + a23 * b31,
+            a20 * b02 + a21 * b12 + a22 * b22 + a23 * b32,
+            a20 * b03 + a21 * b13 + a22 * b23 + a23 * b33,
+            a30 * b00 + a31 * b10 + a32 * b20 + a33 * b30,
+            a30 * b01 + a31 * b11 + a32 * b21 + a33 * b31,
+            a30 * b02 + a31 * b12 + a32 * b22 + a33 * b32,
+            a30 * b03 + a31 * b13 + a32 * b23 + a33 * b33)
+
+
+_DET = {2: _det2, 3: _det3, 4: _det4}
+_INV = {2: _inv2, 3: _inv3, 4: _inv4}
+_MV = {2: _mv2, 3: _mv3, 4: _mv4}
+_MM = {2: _mm2, 3: _mm3, 4: _mm4}
+
+
+def batch_determinant(batch: MatrixBatch) -> array:
+    """det of every matrix of the batch, as an array('d').
+
+    Time complexity: Θ(count) closed-form evaluations.
+    Space complexity: Θ(count) for the result.
+    """
+    return array("d", starmap(_DET[batch._n], batch._groups()))
+
+
+def batch_inverse(batch: MatrixBatch) -> MatrixBatch:
+    """Adjugate inverse of every matrix; ValueError if any of them is singular.
+
+    Time complexity: Θ(count) closed-form evaluations.
+    Space complexity: Θ(count·n²) for the result batch.
+    """
+    kernel = _INV[batch._n]
+    return MatrixBatch.from_flat(batch._n, array("d", chain.from_iterable(starmap(kernel, batch._groups()))))
+
+
+def batch_mat_vec_mul(batch: MatrixBatch, vectors: VectorBatch | Vector) -> VectorBatch:
+    """A_k·v_k for every k, or A_k·v for one broadcast Vector v.
+
+    Time complexity: Θ(count·n²)
+    Space complexity: Θ(count·n) for the result batch.
+    """
+    n = batch._n
+    if isinstance(vectors, VectorBatch):
+        if vectors._n != n or len(vectors) != len(batch):
+            raise ValueError("Batch size mismatch in matrix–vector product")
+        groups = vectors._groups()
+    else:
+        if len(vectors) != n:
+            raise ValueError("Dimension mismatch in matrix–vector product")
+        groups = repeat(tuple(vectors))
+    out = chain.from_iterable(map(_MV[n], batch._groups(), groups))
+    return VectorBatch.from_flat(n, array("d", out))
+
+
+def batch_mat_mat_mul(batch1: MatrixBatch, batch2: MatrixBatch | Matrix) -> MatrixBatch:
+    """A_k·B_k for every k, or A_k·B for one broadcast Matrix B.
+
+    Time complexity: Θ(count·n³)
+    Space complexity: Θ(count·n²) for the result batch.
+    """
+    n = batch1._n
+    if isinstance(batch2, MatrixBatch):
+        if batch2._n != n or len(batch2) != len(batch1):
+            raise ValueError("Batch size mismatch in A·B")
+        groups = batch2._groups()
+    else:
+        if batch2.shape() != (n, n):
+            raise ValueError("Inner dimensions do not match for A·B")
+        groups = repeat(tuple(chain.from_iterable(batch2._m)))
+    out = chain.from_iterable(map(_MM[n], batch1._groups(), groups))
+    return MatrixBatch.from_flat(n, array("d", out))
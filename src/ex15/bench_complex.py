@@ -0,0 +1,97 @@
+"""Per-operation timings of Complex, builtin complex and complex kernels.
+
+The previous frozen-dataclass Complex is kept below as OldComplex, so the
+slotted class is measured against it side by side.
+
+Run: python3 bench_complex.py
+"""
+from dataclasses import dataclass
+from timeit import repeat
+
+from complex import Complex as C
+from all_previous import Matrix, mat_mat_mul, determinant
+
+NUMBER = 200_000
+
+
+@dataclass(frozen=True)
+class OldComplex:
+    """Frozen copy of the former dataclass Complex (benchmark baseline only)."""
+    re: float
+    im: float = 0.0
+
+    @property
+    def real(self) -> float: return self.re
+    @property
+    def imag(self) -> float: return self.im
+
+    def conjugate(self) -> "OldComplex":
+        return OldComplex(self.re, -self.im)
+
+    def __add__(self, other):
+        o = _old_coerce(other)
+        return OldComplex(self.re + o.re, self.im + o.im)
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        o = _old_coerce(other)
+        return OldComplex(self.re - o.re, self.im - o.im)
+    def __rsub__(self, other):
+        o = _old_coerce(other)
+        return OldComplex(o.re - self.re, o.im - self.im)
+
+    def __mul__(self, other):
+        o = _old_coerce(other)
+        return OldComplex(self.re * o.re - self.im * o.im, self.re * o.im + self.im * o.re)
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        o = _old_coerce(other)
+        denom = o.re * o.re + o.im * o.im
+        if denom == 0.0:
+            raise ZeroDivisionError("division by zero")
+        return OldComplex((self.re * o.re + self.im * o.im) / denom,
+                          (self.im * o.re - self.re * o.im) / denom)
+    def __rtruediv__(self, other):
+        return _old_coerce(other).__truediv__(self)
+
+    def __neg__(self):
+        return OldComplex(-self.re, -self.im)
+    def __abs__(self):
+        return (self.re ** 2 + self.im ** 2) ** 0.5
+
+
+def _old_coerce(x) -> OldComplex:
+    if isinstance(x, OldComplex): return x
+    if isinstance(x, (int, float)): return OldComplex(float(x), 0.0)
+    if isinstance(x, complex): return OldComplex(x.real, x.imag)
+    return NotImplemented
+
+
+def per_op(stmt: str, env: dict, number: int = NUMBER) -> float:
+    """Best-of-5 time of one evaluation of stmt, in nanoseconds."""
+    return min(repeat(stmt, globals = env, number = number, repeat = 5)) / number * 1e9
+
+
+def main():
+    ops = [("construct", "C(1.0, 2.0)"), ("a + b", "a + b"), ("a * b", "a * b"),
+           ("a / b", "a / b"), ("a * 2.0", "a * 2.0"), ("a == b", "a == b")]
+    dataclass_ = {"C": OldComplex, "a": OldComplex(1.5, -2.0), "b": OldComplex(0.25, 3.0)}
+    slotted = {"C": C, "a": C(1.5, -2.0), "b": C(0.25, 3.0)}
+    builtin = {"C": complex, "a": 1.5 - 2j, "b": 0.25 + 3j}
+    print(f"{'op':<10}{'old':>12}{'Complex':>12}{'speedup':>9}{'complex':>12}")
+    for name, stmt in ops:
+        old, new = per_op(stmt, dataclass_), per_op(stmt, slotted)
+        print(f"{name:<10}{old:>10.0f}ns{new:>10.0f}ns{old / new:>8.2f}x{per_op(stmt, builtin):>10.0f}ns")
+
+    n = 40
+    for label, make in (("old", OldComplex), ("Complex", C), ("complex", complex)):
+        A = Matrix([[make((i * 7 + j) % 5 - 2.0, (i + 3 * j) % 4 - 1.5) for j in range(n)] for i in range(n)])
+        env = {"A": A, "mat_mat_mul": mat_mat_mul, "determinant": determinant}
+        mm = per_op("mat_mat_mul(A, A)", env, number = 3) / 1e6
+        det = per_op("determinant(A)", env, number = 3) / 1e6
+        print(f"{label} {n}x{n}: mat_mat_mul {mm:.1f} ms, determinant {det:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
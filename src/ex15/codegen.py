@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import combinations
+from typing import Callable, List
+import math
+
+KERNEL_CACHE_SIZE = 128 # compiled kernels kept by the LRU
+CODEGEN_MAX_ELEMS = 512 # largest m·n (mat_vec_mul) or m·n·p (mat_mat_mul) that gets unrolled
+CODEGEN_MAX_DET = 5 # largest n whose determinant is unrolled (cofactor expansion)
+OPS = ("mat_vec_mul", "mat_mat_mul", "determinant")
+# Per-entry primitive, matching the loop kernel it replaces (same rounding):
+#   chain   : z + a0*b0 + a1*b1 + … left to right (plain Python accumulation)
+#   sumprod : z + math.sumprod(row, col)          (mat_mat_mul, Python 3.12+)
+#   fma     : acc = fma(a, b, acc) from 0.0        (float mat_vec_mul with math.fma)
+PRIMS = {"mat_vec_mul": ("chain", "fma"), "mat_mat_mul": ("chain", "sumprod"), "determinant": ("chain",)}
+
+_seen: set = set() # keys met once; the second call compiles (see specialized())
+
+
+def _names(prefix: str, rows: int, cols: int) -> List[List[str]]:
+    return [[f"{prefix}{i}_{j}" for j in range(cols)] for i in range(rows)]
+
+
+def _unpack(names: List[List[str]]) -> str:
+    return ", ".join("(" + ", ".join(row) + ",)" for row in names) + ","
+
+
+def _sum(terms: List[str]) -> str:
+    return " + ".join(terms) # left to right, the same order as the loop kernels
+
+
+def _src_mat_vec_mul(m: int, n: int, prim: str = "chain") -> str:
+    a = _names("a", m, n)
+    u = [f"u{j}" for j in range(n)]
+    lines = ["def kernel(rows, u):", f"    {_unpack(a)} = rows", f"    {', '.join(u)}, = u"]
+    if prim == "fma": # one statement per step: fma nesting would exceed the parser's limit
+        for i in range(m):
+            lines.append(f"    r{i} = 0.0")
+            lines.extend(f"    r{i} = fma({a[i][j]}, {u[j]}, r{i})" for j in range(n))
+        lines.append(f"    return [{', '.join(f'r{i}' for i in range(m))}]")
+    else:
+        lines.append("    z = u0 - u0")
+        body = ", ".join(_sum(["z"] + [f"{a[i][j]} * {u[j]}" for j in range(n)]) for i in range(m))
+        lines.append(f"    return [{body}]")
+    return "\n".join(lines) + "\n"
+
+
+def _src_mat_mat_mul(m: int, n: int, p: int, prim: str = "chain") -> str:
+    a = _names("a", m, n)
+    b = _names("b", n, p)
+    def entry(i: int, j: int) -> str:
+        if prim == "sumprod":
+            return (f"z + sumprod(({', '.join(a[i])},), "
+                    f"({', '.join(b[k][j] for k in range(n))},))")
+        return _sum(["z"] + [f"{a[i][k]} * {b[k][j]}" for k in range(n)])
+    rows = ("[" + ", ".join(entry(i, j) for j in range(p)) + "]" for i in range(m))
+    return (f"def kernel(rows1, rows2):\n"
+            f"    {_unpack(a)} = rows1\n"
+            f"    {_unpack(b)} = rows2\n"
+            f"    z = a0_0 - a0_0\n"
+            f"    return [{', '.join(rows)}]\n")
+
+
+def _src_determinant(n: int) -> str:
+    """Laplace expansion along the top row; minors of the bottom k rows are
+    shared locals (one per column subset), so the cost is O(n·2ⁿ), not O(n!)."""
+    a = _names("a", n, n)
+    lines = [f"def kernel(rows):", f"    {_unpack(a)} = rows"]
+    minor = {(c,): a[n - 1][c] for c in range(n)}
+    for k in range(2, n + 1):
+        r = n - k # row expanded at this level
+        for cols in combinations(range(n), k):
+            terms = []
+            for t, c in enumerate(cols):
+                rest = cols[:t] + cols[t + 1:]
+                terms.append(("- " if t % 2 else "+ ") + f"{a[r][c]} * {minor[rest]}")
+            expr = " ".join(terms)[2:]
+            if k == n:
+                lines.append(f"    return {expr}")
+            else:
+                name = "m" + "_".join(map(str, cols))
+                lines.append(f"    {name} = {expr}")
+                minor[cols] = name
+    if n == 1:
+        lines.append(f"    return {a[0][0]}")
+    return "\n".join(lines) + "\n"
+
+
+_SOURCES = {"mat_vec_mul": _src_mat_vec_mul, "mat_mat_mul": _src_mat_mat_mul, "determinant": _src_determinant}
+
+
+def kernel_source(op: str, shape: tuple, prim: str = "chain") -> str:
+    """Python source of the straight-line kernel for op at this shape."""
+    if op not in _SOURCES:
+        raise ValueError(f"op must be one of {OPS}")
+    if prim not in PRIMS[op]:
+        raise ValueError(f"prim for {op} must be one of {PRIMS[op]}")
+    return _SOURCES[op](*shape, prim) if prim != "chain" else _SOURCES[op](*shape)
+
+
+@lru_cache(maxsize = KERNEL_CACHE_SIZE)
+def kernel(op: str, shape: tuple, dtype: str, prim: str = "chain") -> Callable:
+    """Compile (once per (op, shape, dtype, prim) key) a fully unrolled kernel.
+
+    mat_vec_mul: kernel(rows, u) -> list       (rows: m rows of n, u: n values)
+    mat_mat_mul: kernel(rows1, rows2) -> rows  (m×n times n×p, row sequences)
+    determinant: kernel(rows) -> value         (n×n)
+
+    Every entry is a named local and every loop is gone, so a call is one
+    tuple unpack plus the arithmetic itself. Each entry is accumulated with
+    `prim` (see PRIMS), the primitive of the loop kernel it stands in for, so
+    both give the same bits. The dtype is part of the key so that kernels for
+    different element types never share cache slots.
+    """
+    namespace: dict = {"sumprod": getattr(math, "sumprod", None), "fma": getattr(math, "fma", None)}
+    exec(compile(kernel_source(op, shape, prim), f"<{op} {'x'.join(map(str, shape))} {dtype} {prim}>", "exec"),
+         namespace)
+    return namespace["kernel"]
+
+
+def specialized(op: str, shape: tuple, dtype: str, prim: str = "chain") -> Callable | None:
+    """Kernel for this key if it is small enough and has been seen before, else None.
+
+    The first call with a key only records it: one-off shapes never pay for
+    code generation, repeated ones run unrolled from the second call on.
+    """
+    if op == "determinant":
+        if shape[0] > CODEGEN_MAX_DET:
+            return None
+    elif math.prod(shape) > CODEGEN_MAX_ELEMS:
+        return None
+    key = (op, shape, dtype, prim)
+    if key not in _seen:
+        _seen.add(key)
+        return None
+    return kernel(op, shape, dtype, prim)
+
+
+def kernel_cache_clear() -> None:
+    """Forget compiled kernels and seen shapes."""
+    kernel.cache_clear()
+    _seen.clear()
@@ -1,59 +1,110 @@
 from __future__ import annotations
-from dataclasses import dataclass
 from numbers import Complex as ABCComplex
 import math
 
-@dataclass(frozen=True)
 class Complex:
-    re: float
-    im: float = 0.0
+    """Immutable complex scalar (re, im) with slotted storage.
 
+    __slots__ replace the frozen dataclass: results are built by _make,
+    object.__new__ plus two slot stores (no __init__, no object.__setattr__), and
+    Complex ∘ Complex operations skip _coerce after one `type(...) is` test.
+    re / im are read-only properties, so values stay immutable and hashable.
+    """
+    __slots__ = ("_re", "_im")
+
+    def __init__(self, re: float, im: float = 0.0) -> None:
+        self._re = re
+        self._im = im
+
+    @property
+    def re(self) -> float: return self._re
+    @property
+    def im(self) -> float: return self._im
 
     @property
-    def real(self) -> float: return self.re
+    def real(self) -> float: return self._re
     @property
-    def imag(self) -> float: return self.im
+    def imag(self) -> float: return self._im
 
     def conjugate(self) -> "Complex":
-        return Complex(self.re, -self.im)
+        return _make(self._re, -self._im)
+
+    # value semantics (same as the former frozen dataclass)
+    def __eq__(self, other):
+        if type(other) is not Complex:
+            return NotImplemented
+        return self._re == other._re and self._im == other._im
+
+    def __hash__(self) -> int:
+        return hash((self._re, self._im))
+
+    def __reduce__(self):
+        return Complex, (self._re, self._im)
 
     # arithmetic
     def __add__(self, other):
-        o = _coerce(other)
-        return Complex(self.re + o.re, self.im + o.im)
+        if type(other) is not Complex:
+            other = _coerce(other)
+            if other is NotImplemented:
+                return NotImplemented
+        return _make(self._re + other._re, self._im + other._im)
     __radd__ = __add__
 
     def __sub__(self, other):
-        o = _coerce(other)
-        return Complex(self.re - o.re, self.im - o.im)
+        if type(other) is not Complex:
+            other = _coerce(other)
+            if other is NotImplemented:
+                return NotImplemented
+        return _make(self._re - other._re, self._im - other._im)
     def __rsub__(self, other):
         o = _coerce(other)
-        return Complex(o.re - self.re, o.im - self.im)
+        if o is NotImplemented:
+            return NotImplemented
+        return _make(o._re - self._re, o._im - self._im)
 
     def __mul__(self, other):
-        o = _coerce(other)
-        return Complex(self.re * o.re - self.im * o.im, self.re * o.im + self.im * o.re)
+        if type(other) is not Complex:
+            other = _coerce(other)
+            if other is NotImplemented:
+                return NotImplemented
+        a, b, c, d = self._re, self._im, other._re, other._im
+        return _make(a * c - b * d, a * d + b * c)
     __rmul__ = __mul__
 
     def __truediv__(self, other):
-        o = _coerce(other)
-        denom = o.re * o.re + o.im * o.im
+        if type(other) is not Complex:
+            other = _coerce(other)
+            if other is NotImplemented:
+                return NotImplemented
+        a, b, c, d = self._re, self._im, other._re, other._im
+        denom = c * c + d * d
         if denom == 0.0:
             raise ZeroDivisionError("division by zero")
-        return Complex((self.re * o.re + self.im * o.im) / denom,
-                       (self.im * o.re - self.re * o.im) / denom)
+        return _make((a * c + b * d) / denom, (b * c - a * d) / denom)
     def __rtruediv__(self, other):
-        return _coerce(other).__truediv__(self)
+        o = _coerce(other)
+        if o is NotImplemented:
+            return NotImplemented
+        return o.__truediv__(self)
 
     def __neg__(self):
-        return Complex(-self.re, -self.im)
+        return _make(-self._re, -self._im)
     def __abs__(self):
-        return (self.re ** 2 + self.im ** 2) ** 0.5
+        return (self._re ** 2 + self._im ** 2) ** 0.5
 
     def __repr__(self) -> str:
-        sign = "+" if self.im >= 0 else "-"
-        im_part = f"{abs(self.im)}" if abs(self.im) != 1 else ""
-        return f"({self.re} {sign} {im_part}i)"
+        sign = "+" if self._im >= 0 else "-"
+        im_part = f"{abs(self._im)}" if abs(self._im) != 1 else ""
+        return f"({self._re} {sign} {im_part}i)"
+
+_new = object.__new__
+
+def _make(re: float, im: float) -> Complex:
+    """Result constructor: allocate and fill the two slots, no __init__ call."""
+    z = _new(Complex)
+    z._re = re
+    z._im = im
+    return z
 
 def _coerce(x) -> Complex:
     """
@@ -63,8 +114,8 @@ def _coerce(x) -> Complex:
     @return: A Complex instance or NotImplemented.
     """
     if isinstance(x, Complex): return x
-    if isinstance(x, (int, float)): return Complex(float(x), 0.0)
-    if isinstance(x, complex): return Complex(x.real, x.imag)
+    if isinstance(x, (int, float)): return _make(float(x), 0.0)
+    if isinstance(x, complex): return _make(x.real, x.imag)
     return NotImplemented
 
 # Make isinstance(z, numbers.Number) true:
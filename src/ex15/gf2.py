@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from typing import Sequence, List
+
+from matrix import Matrix
+
+_TABLE_BITS = 8 # rows of B combined per lookup table in gf2_mat_mat_mul (Four Russians)
+
+
+class GF2Matrix:
+    """Matrix over GF(2) with each row packed into one Python int bitset.
+
+    Bit j of row i is entry (i, j), so a row operation is a single XOR on an
+    arbitrary-precision int instead of a loop over cols Python objects.
+    """
+
+    def __init__(self, rows: Sequence[Sequence[int]]) -> None:
+        if not rows: # 0×0 not allowed
+            raise ValueError("Matrix cannot be empty")
+        row_lengths = {len(r) for r in rows}
+        if len(row_lengths) != 1:
+            raise ValueError("All rows must have the same length")
+        self._rows: List[int] = [_pack(r) for r in rows]
+        self._shape = (len(rows), len(rows[0])) # (rows, cols)
+
+    @classmethod
+    def _from_packed(cls, rows: List[int], cols: int) -> "GF2Matrix":
+        obj = cls.__new__(cls)
+        obj._rows = rows
+        obj._shape = (len(rows), cols)
+        return obj
+
+    @classmethod
+    def from_matrix(cls, mat: Matrix) -> "GF2Matrix":
+        """Pack an integer Matrix, reducing every entry mod 2."""
+        return cls(mat._m)
+
+    def to_matrix(self) -> Matrix[int]:
+        """Unpack into a Matrix of 0/1 ints."""
+        return Matrix([self[i] for i in range(self._shape[0])])
+
+
+    # Helpers
+    def __len__(self) -> int: return self._shape[0]  # nb rows
+
+    def shape(self) -> tuple[int, int]: return self._shape
+
+    def is_square(self) -> bool:
+        """Return True if matrix is square."""
+        rows, cols = self.shape()
+        return rows == cols
+
+    def __getitem__(self, key):
+        # mat[i, j] -> bit
+        if isinstance(key, tuple) and len(key) == 2:
+            r, c = key
+            return (self._rows[r] >> c) & 1
+        # mat[i] -> unpacked copy of the row
+        elif isinstance(key, int):
+            row = self._rows[key]
+            return [(row >> c) & 1 for c in range(self._shape[1])]
+        else:
+            raise TypeError("Index must be int or (int, int)")
+
+    def __setitem__(self, key, value):
+        if isinstance(key, tuple) and len(key) == 2:
+            r, c = key
+            if value & 1:
+                self._rows[r] |= 1 << c
+            else:
+                self._rows[r] &= ~(1 << c)
+        elif isinstance(key, int):
+            if len(value) != self._shape[1]:
+                raise ValueError("Row length mismatch")
+            self._rows[key] = _pack(value)
+        else:
+            raise TypeError("Index must be int or (int, int)")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GF2Matrix):
+            return NotImplemented
+        return self._shape == other._shape and self._rows == other._rows
+
+    def __repr__(self) -> str:
+        return "GF2Matrix([" + ",\n           ".join(str(self[i]) for i in range(self._shape[0])) + "])"
+
+    def _check_same_shape(self, other: "GF2Matrix") -> None:
+        if self._shape != other._shape:
+            raise ValueError("Matrix shape mismatch")
+
+
+    # Immutable operators (addition and subtraction are both XOR in GF(2))
+    def __add__(self, other: "GF2Matrix") -> "GF2Matrix":
+        self._check_same_shape(other)
+        return GF2Matrix._from_packed([a ^ b for a, b in zip(self._rows, other._rows)], self._shape[1])
+    __sub__ = __add__
+
+
+    # Mutating operators
+    def add(self, m: "GF2Matrix") -> None:
+        self._check_same_shape(m)
+        self._rows = [a ^ b for a, b in zip(self._rows, m._rows)]
+    sub = add
+
+
+def _pack(row: Sequence[int]) -> int:
+    bits = 0
+    for c, x in enumerate(row):
+        if x & 1:
+            bits |= 1 << c
+    return bits
+
+
+def _eliminate(rows: List[int], cols: int, reduced: bool) -> int:
+    """Gaussian elimination over GF(2) in place on packed rows; return the rank.
+
+    reduced=True clears each pivot column above the pivot too (RREF).
+    Each elimination step is one XOR per affected row.
+    """
+    m = len(rows)
+    row = 0
+    for col in range(cols):
+        if row == m:
+            break
+        bit = 1 << col
+        piv = next((r for r in range(row, m) if rows[r] & bit), None)
+        if piv is None:
+            continue # full column of zeros: skip
+        rows[row], rows[piv] = rows[piv], rows[row]
+        pr = rows[row]
+        rows[row + 1:] = [x ^ pr if x & bit else x for x in rows[row + 1:]]
+        if reduced:
+            rows[:row] = [x ^ pr if x & bit else x for x in rows[:row]]
+        row += 1
+    return row
+
+
+def gf2_rank(mat: GF2Matrix) -> int:
+    """Rank over GF(2).
+
+    Time complexity: O(m·n·min(m, n)/w) word operations (w = machine word bits).
+    Space complexity: O(m·n/w) for the packed working copy.
+    """
+    return _eliminate(list(mat._rows), mat._shape[1], reduced = False)
+
+
+def gf2_row_echelon(mat: GF2Matrix) -> GF2Matrix:
+    """Reduced row-echelon form over GF(2).
+
+    Time complexity: O(m·n·min(m, n)/w) word operations.
+    """
+    rows = list(mat._rows)
+    _eliminate(rows, mat._shape[1], reduced = True)
+    return GF2Matrix._from_packed(rows, mat._shape[1])
+
+
+def gf2_inverse(mat: GF2Matrix) -> GF2Matrix:
+    """Inverse over GF(2) by Gauss–Jordan on [A | I] packed in the same ints.
+
+    Time complexity: O(n^3/w) word operations.
+    """
+    n_rows, n_cols = mat.shape()
+    if n_rows != n_cols:
+        raise ValueError("Inverse exists only for square matrices")
+    n = n_rows
+    aug = [row | (1 << (n + i)) for i, row in enumerate(mat._rows)] # A | I
+    if _eliminate(aug, n, reduced = True) != n:
+        raise ValueError("Matrix is singular (zero pivot)")
+    return GF2Matrix._from_packed([row >> n for row in aug], n)
+
+
+def gf2_mat_mat_mul(mat1: GF2Matrix, mat2: GF2Matrix) -> GF2Matrix:
+    """Product over GF(2) with the Method of Four Russians.
+
+    B's rows are grouped by _TABLE_BITS; for each group a table of all 2^k
+    XOR combinations is built once, then every row of A picks its
+    combination with one lookup.
+
+    Time complexity: O(n/k · (2^k + m)) XORs of p-bit rows.
+    Space complexity: O(2^k · p/w) for one table.
+    """
+    m, n = mat1.shape()
+    n2, p = mat2.shape()
+    if n != n2:
+        raise ValueError("Inner dimensions do not match for A·B")
+    k = _TABLE_BITS
+    mask = (1 << k) - 1
+    B = mat2._rows
+    out = [0] * m
+    for start in range(0, n, k):
+        group = B[start:start + k]
+        table = [0] * (1 << len(group))
+        for idx in range(1, len(table)):
+            low = idx & -idx
+            table[idx] = table[idx ^ low] ^ group[low.bit_length() - 1]
+        out = [acc ^ table[(a >> start) & mask] for acc, a in zip(out, mat1._rows)]
+    return GF2Matrix._from_packed(out, p)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List
+
+# Opt-in switch, see lazy_mode(): per thread / asyncio task, never process-wide
+_lazy_enabled: ContextVar[bool] = ContextVar("lazy_enabled", default = False)
+_kernels: dict = {} # expression source -> compiled element function
+
+
+def is_lazy() -> bool:
+    """True inside a lazy_mode() block."""
+    return _lazy_enabled.get()
+
+
+@contextmanager
+def lazy_mode(enabled: bool = True) -> Iterator[None]:
+    """Make Vector/Matrix +, -, * build expression trees instead of results.
+
+    The trees are evaluated in one fused pass on .eval() or as soon as the
+    value is read (indexing, iteration, len, attributes, repr).
+    The switch lives in a ContextVar: other threads (and worker pools
+    started elsewhere) keep eager operators while the block runs.
+    """
+    token = _lazy_enabled.set(enabled)
+    try:
+        yield
+    finally:
+        _lazy_enabled.reset(token)
+
+
+class Expr:
+    """Node of a lazy Vector/Matrix expression: leaf, a + b, a - b or k * a.
+
+    eval() turns the whole tree into one element-wise Python function (same
+    operation order as the eager operators, so the same rounding) and maps
+    it over the leaves once: no intermediate Vector/Matrix is allocated.
+    """
+    __slots__ = ("_op", "_args", "_shape", "_value")
+
+    def __init__(self, op: str, args: tuple, shape: tuple) -> None:
+        self._op = op
+        self._args = args
+        self._shape = shape
+        self._value = None
+
+    @classmethod
+    def leaf(cls, value) -> "Expr":
+        if isinstance(value, Expr):
+            return value
+        shape = value.shape() if hasattr(value, "_m") else (len(value),)
+        return cls("leaf", (value,), shape)
+
+    def _binary(self, op: str, other) -> "Expr":
+        other = Expr.leaf(other)
+        if self._shape != other._shape:
+            raise ValueError("Shape mismatch in lazy expression")
+        return Expr(op, (self, other), self._shape)
+
+    def __add__(self, other) -> "Expr": return self._binary("add", other)
+    def __radd__(self, other) -> "Expr": return Expr.leaf(other)._binary("add", self)
+    def __sub__(self, other) -> "Expr": return self._binary("sub", other)
+    def __rsub__(self, other) -> "Expr": return Expr.leaf(other)._binary("sub", self)
+
+    def __mul__(self, k) -> "Expr":
+        if isinstance(k, Expr) or hasattr(k, "_m") or hasattr(k, "_data"):
+            return NotImplemented # only scalar scaling is element-wise
+        return Expr("scale", (k, self), self._shape)
+    __rmul__ = __mul__
+
+
+    # Code generation
+    def _emit(self, leaves: List, scalars: List, slots: dict) -> str:
+        """Python source for one element; parentheses only where order needs them."""
+        if self._op == "leaf":
+            obj = self._args[0]
+            if id(obj) not in slots: # the same operand is read once per element
+                slots[id(obj)] = f"x{len(leaves)}"
+                leaves.append(obj)
+            return slots[id(obj)]
+        if self._op == "scale":
+            k, a = self._args
+            scalars.append(k)
+            name = f"k{len(scalars) - 1}"
+            inner = a._emit(leaves, scalars, slots)
+            return f"{name} * {inner}" if a._op == "leaf" else f"{name} * ({inner})"
+        a, b = self._args
+        sign = "+" if self._op == "add" else "-"
+        left = a._emit(leaves, scalars, slots) # + and - are left-associative
+        right = b._emit(leaves, scalars, slots)
+        if b._op in ("add", "sub"):
+            right = f"({right})"
+        return f"{left} {sign} {right}"
+
+    def eval(self):
+        """Evaluate the tree in one fused pass (cached)."""
+        if self._value is None:
+            leaves, scalars = [], []
+            body = self._emit(leaves, scalars, {})
+            params = ", ".join(f"x{i}" for i in range(len(leaves)))
+            consts = ", ".join(f"k{i}" for i in range(len(scalars)))
+            src = f"lambda {consts}: lambda {params}: {body}"
+            if src not in _kernels:
+                _kernels[src] = eval(src)
+            fn = _kernels[src](*scalars)
+            first = leaves[0]
+            if hasattr(first, "_m"): # Matrix: fuse row by row
+                rows = [list(map(fn, *row_group)) for row_group in zip(*(leaf._m for leaf in leaves))]
+                self._value = type(first)._like(rows, first.storage)
+            else:
+                self._value = type(first)._like(map(fn, *leaves), first.storage)
+        return self._value
+
+
+    # Reading an expression evaluates it on demand
+    def __len__(self) -> int: return len(self.eval())
+    def __iter__(self): return iter(self.eval())
+    def __getitem__(self, key): return self.eval()[key]
+    def __getattr__(self, name): return getattr(self.eval(), name)
+    def __repr__(self) -> str: return repr(self.eval())
+
+
+def lazy(value) -> Expr:
+    """Wrap a Vector or Matrix as an expression leaf (explicit opt-in)."""
+    return Expr.leaf(value)
@@ -38,6 +38,9 @@ def main():
     print("A·B =", mat_mat_mul(A, B), "\n")
     print("trace(A) =", trace(A), "\n")
     print("transpose(A) =", transpose(A), "\n")
+    At = transpose(A, view = True)
+    print("transpose(A, view=True) =", At, " is_view =", At.is_view)
+    print("A·Aᵀ (view) =", mat_mat_mul(A, At), "\n")
     print("det(A) =", determinant(A), "\n")
     invA = inverse(A)
     print("inverse(A) =", invA)
@@ -52,5 +55,35 @@ def main():
     print("row_echelon(M) =", row_echelon(M), "\n")
     print("rank(M) =", rank(M), "\n")
 
+    print("\n=== Array storage ===", "\n")
+    R = Matrix([[2.0, 1.0], [1.0, 3.0]], storage = "array")
+    x = Vector([1.0, -1.0], storage = "array")
+    print("R =", R, " storage =", R.storage, " strides =", R.strides)
+    print("R·x =", mat_vec_mul(R, x))
+    print("R·R =", mat_mat_mul(R, R))
+    print("det(R) =", determinant(R), "\n")
+
+    print("\n=== LU factorization ===", "\n")
+    F = lu(R)
+    print("lu(R).det() =", F.det(), " rank =", F.rank())
+    print("lu(R).inverse() =", F.inverse())
+    print("lu(R).solve(R·x) =", F.solve(mat_vec_mul(R, x)), "\n")
+    print("solve(A, A·w) =", solve(A, mat_vec_mul(A, w)), "\n")
+
+    print("\n=== Lazy expressions ===", "\n")
+    with lazy_mode():
+        e = R + 0.5 * (R - R * 2.0)
+    print("type =", type(e).__name__, " fused =", e.eval(), "\n")
+
+    print("\n=== Batched 2×2 ===", "\n")
+    Q = MatrixBatch([[[1.0, 2.0], [3.0, 4.0]], [[2.0, 0.0], [0.0, 0.5]]])
+    print(Q, " dets =", list(determinant(Q)))
+    print("inverse(Q)[0] =", inverse(Q)[0], "\n")
+
+    print("\n=== Packed triangular ===", "\n")
+    T = PackedMatrix.from_matrix(R, "upper")
+    print(T, " det =", determinant(T), " trace =", trace(T))
+    print("transpose(T).kind =", transpose(T).kind, " solve(T, x) =", solve(T, x), "\n")
+
 if __name__ == "__main__":
     main()
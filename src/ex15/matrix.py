@@ -1,23 +1,299 @@
 from __future__ import annotations
 
-from typing import TypeVar, Generic, Sequence, List, TYPE_CHECKING
+from typing import TypeVar, Generic, Sequence, List, Optional, TYPE_CHECKING
 from numbers import Number
+from array import array
+from itertools import chain
+from weakref import WeakSet
+
+from lazy import Expr, is_lazy
 
 if TYPE_CHECKING:
     from vector import Vector
 
 T = TypeVar('T', bound = Number)
 
+STORAGES = ("list", "array")
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+_FLOAT_EXACT_INT = 1 << 53 # larger ints do not survive a round trip through float64
+
+
+def _array_typecode(values) -> Optional[str]:
+    """Return the array typecode holding every value exactly, or None.
+
+    'q' (int64) when all values are ints in range, 'd' (float64) when floats
+    are mixed with ints of at most 53 bits, None otherwise: wider ints stay
+    exact only as Python ints, and complex, Fraction, ... need list storage.
+    """
+    code, wide = "q", False
+    for x in values:
+        if type(x) is float:
+            code = "d"
+        elif isinstance(x, int):
+            if not (_INT64_MIN <= x <= _INT64_MAX):
+                return None
+            wide = wide or not (-_FLOAT_EXACT_INT <= x <= _FLOAT_EXACT_INT)
+        else:
+            return None
+    return None if code == "d" and wide else code
+
+
+def _widened_typecode(current: array, values) -> Optional[str]:
+    """Storage for an int64 buffer about to receive `values` that do not fit:
+    'd' for floats, None (list storage) for ints beyond int64; "q" when the
+    values are not reals, so the write should fail as it did."""
+    values = list(values)
+    if not all(isinstance(x, (int, float)) for x in values):
+        return "q"
+    return _array_typecode(chain(current, values))
+
+
+DTYPES = ("float", "int", "Fraction", "Complex", "complex", "mixed")
+_TYPECODE_DTYPE = {"d": "float", "q": "int"}
+
+
+def _dtype_of(values) -> str:
+    """Return the element-type tag of values: the common type name, or "mixed"."""
+    kinds = {type(x) for x in values}
+    if len(kinds) == 1:
+        name = kinds.pop().__name__
+        if name in DTYPES:
+            return name
+    return "mixed"
+
+
+class _RowRun:
+    """Zero-copy strided run inside one row list: row[start + j·step], j < length."""
+    __slots__ = ("_row", "_start", "_step", "_len")
+
+    def __init__(self, row: list, start: int, step: int, length: int) -> None:
+        self._row, self._start, self._step, self._len = row, start, step, length
+
+    def __len__(self) -> int: return self._len
+
+    def _index(self, j: int) -> int:
+        if j < 0:
+            j += self._len
+        if not 0 <= j < self._len:
+            raise IndexError("view index out of range")
+        return self._start + j * self._step
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return self.tolist()[j]
+        return self._row[self._index(j)]
+
+    def __setitem__(self, j: int, value) -> None: self._row[self._index(j)] = value
+
+    def __iter__(self): return iter(self.tolist())
+
+    def tolist(self) -> list:
+        return self._row[self._start:self._start + self._len * self._step:self._step]
+
+
+class _ColumnRun:
+    """Zero-copy strided run down one column of row lists: rows[start + i·step][col]."""
+    __slots__ = ("_rows", "_col", "_start", "_step", "_len")
+
+    def __init__(self, rows: list, col: int, start: int, step: int, length: int) -> None:
+        self._rows, self._col, self._start, self._step, self._len = rows, col, start, step, length
+
+    def __len__(self) -> int: return self._len
+
+    def _index(self, i: int) -> int:
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("view index out of range")
+        return self._start + i * self._step
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self.tolist()[i]
+        return self._rows[self._index(i)][self._col]
+
+    def __setitem__(self, i: int, value) -> None: self._rows[self._index(i)][self._col] = value
+
+    def __iter__(self): return iter(self.tolist())
+
+    def tolist(self) -> list:
+        col = self._col
+        return [row[col] for row in self._rows[self._start:self._start + self._len * self._step:self._step]]
+
+
+class _ConjRun:
+    """Zero-copy conjugating wrapper over a row sequence (rows of an adjoint view)."""
+    __slots__ = ("_run",)
+
+    def __init__(self, run) -> None:
+        self._run = run
+
+    def __len__(self) -> int: return len(self._run)
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return self.tolist()[j]
+        return self._run[j].conjugate()
+
+    def __setitem__(self, j: int, value) -> None: self._run[j] = value.conjugate()
+
+    def __iter__(self): return iter(self.tolist())
+
+    def tolist(self) -> list:
+        return [x.conjugate() for x in self._run]
+
+
+_REAL_TAGS = ("float", "int", "Fraction") # conjugation is the identity for these dtypes
+
+
 class Matrix(Generic[T]):
 
-    def __init__(self, rows: Sequence[Sequence[T]]) -> None:
+    def __init__(self, rows: Sequence[Sequence[T]], storage: str = "list") -> None:
+        """Build a matrix from a sequence of rows.
+
+        storage="list"  : list of Python lists (any numeric type, default).
+        storage="array" : one flat array('d') / array('q') buffer with explicit
+                          shape and strides, rows exposed as memoryview slices.
+                          ~4x less memory for real matrices, contiguous rows.
+                          An int64 buffer is widened to float64 by the first
+                          float written into it; ints beyond int64 keep list
+                          storage (exact), here and on later writes.
+        """
         if not rows: # 0×0 not allowed
             raise ValueError("Matrix cannot be empty")
         row_lengths = {len(r) for r in rows}
         if len(row_lengths) != 1:
             raise ValueError("All rows must have the same length")
-        self._m: List[List[T]] = [list(r) for r in rows]
-        self._shape = (len(rows), len(rows[0])) # (rows, cols)
+        if storage not in STORAGES:
+            raise ValueError(f"storage must be one of {STORAGES}")
+        self._init_owner((len(rows), len(rows[0])))
+
+        if storage == "array":
+            code = _array_typecode(chain.from_iterable(rows))
+            if code is None:
+                raise TypeError("array storage requires float or int64 elements")
+            self._init_buffer(array(code, chain.from_iterable(rows)))
+        else:
+            self._m: List[List[T]] = [list(r) for r in rows]
+
+    def _init_owner(self, shape: tuple[int, int]) -> None:
+        """Geometry and caches of a matrix owning its storage (rows set by the caller)."""
+        self._shape = shape # (rows, cols)
+        self._buf: Optional[array] = None
+        self._dtype: Optional[str] = None # element-type tag, computed on first use
+        # View geometry relative to the owner: view (i, j) is owner
+        # (r0 + i'·rs, c0 + j'·cs) with (i', j') = (j, i) when transposed.
+        self._base: Optional[Matrix[T]] = None # owner of the storage, None if self owns it
+        self._origin, self._steps, self._transposed = (0, 0), (1, 1), False
+        self._conjugated = False # entries read through conjugate() (adjoint views)
+        self._offset, self._strides = 0, (shape[1], 1)
+        # Live views over an array buffer, rebuilt by _widen; created with the first one
+        self._views: Optional[WeakSet] = None
+
+    def __getstate__(self) -> dict:
+        """Shape, storage and the entries as one flat row-major sequence (a
+        view is saved as the matrix it shows, without its owner)."""
+        flat = chain.from_iterable(self._m)
+        data = array(self._buf.typecode, flat) if self._buf is not None else list(flat)
+        return {"shape": self._shape, "storage": self.storage, "data": data}
+
+    def __setstate__(self, state: dict) -> None:
+        """Rebuild an owning matrix: buffer and memoryview rows, or row lists."""
+        self._init_owner(state["shape"])
+        data = state["data"]
+        if state["storage"] == "array":
+            self._init_buffer(data)
+        else:
+            rows, cols = self._shape
+            self._m = [data[r * cols:(r + 1) * cols] for r in range(rows)]
+
+    def _init_buffer(self, buf: array) -> None:
+        """Attach a flat row-major buffer and build the memoryview rows over it."""
+        rows, cols = self._shape
+        self._buf = buf
+        self._dtype = _TYPECODE_DTYPE[buf.typecode]
+        view = memoryview(buf)
+        self._m = [view[r * cols:(r + 1) * cols] for r in range(rows)]
+
+    @classmethod
+    def _view(cls, owner: "Matrix[T]", origin: tuple[int, int], steps: tuple[int, int],
+              shape: tuple[int, int], transposed: bool, conjugated: bool = False) -> "Matrix[T]":
+        """Build a Matrix sharing owner's storage (no element is copied)."""
+        view = cls.__new__(cls)
+        view._shape = shape
+        view._buf = owner._buf
+        view._dtype = owner._dtype if owner._buf is not None else None # list views never cache
+        view._base = owner
+        view._origin, view._steps, view._transposed = origin, steps, transposed
+        view._conjugated = conjugated
+        cols = owner._shape[1]
+        (r0, c0), (rs, cs) = origin, steps
+        view._offset = r0 * cols + c0
+        view._strides = (cs, rs * cols) if transposed else (rs * cols, cs)
+        view._m = view._view_rows()
+        if owner._buf is not None: # only array storage is ever re-stored (see _widen)
+            if owner._views is None:
+                owner._views = WeakSet()
+            owner._views.add(view)
+        return view
+
+    def _view_rows(self) -> list:
+        """Row sequences of a view: strided memoryviews, or run proxies over owner rows."""
+        rows = self._plain_view_rows()
+        return [_ConjRun(row) for row in rows] if self._conjugated else rows
+
+    def _plain_view_rows(self) -> list:
+        rows, cols = self._shape
+        if self._buf is not None:
+            buf = memoryview(self._buf)
+            s_r, s_c = self._strides
+            return [buf[start:start + (cols - 1) * s_c + 1:s_c]
+                    for start in range(self._offset, self._offset + rows * s_r, s_r)]
+        owner_rows = self._base._m
+        (r0, c0), (rs, cs) = self._origin, self._steps
+        if self._transposed: # view row i is owner column c0 + i·cs
+            return [_ColumnRun(owner_rows, c0 + i * cs, r0, rs, cols) for i in range(rows)]
+        if c0 == 0 and cs == 1 and cols == self._base._shape[1]: # whole owner rows
+            return [owner_rows[r0 + i * rs] for i in range(rows)]
+        return [_RowRun(owner_rows[r0 + i * rs], c0, cs, cols) for i in range(rows)]
+
+    def _widen(self, values) -> bool:
+        """Re-store an int64 buffer so `values` fit: float64, or plain lists for
+        ints beyond int64. The owner and every live view over it switch to the
+        new storage. False when the storage is not int64 or would not change."""
+        owner = self if self._base is None else self._base
+        buf = owner._buf
+        if buf is None or buf.typecode != "q":
+            return False
+        code = _widened_typecode(buf, values)
+        if code == "q":
+            return False
+        if code == "d":
+            owner._init_buffer(array("d", buf))
+        else:
+            cols = owner._shape[1]
+            owner._m = [buf[r * cols:(r + 1) * cols].tolist() for r in range(owner._shape[0])]
+            owner._buf, owner._dtype = None, None
+        for view in owner._views or ():
+            view._buf, view._dtype = owner._buf, owner._dtype
+            view._m = view._view_rows()
+        return True
+
+    def _put(self, i: int, j: int, value: T) -> None:
+        """self._m[i][j] = value, widening an int64 buffer that cannot hold it."""
+        try:
+            self._m[i][j] = value
+        except (TypeError, ValueError):
+            if not self._widen((value,)):
+                raise
+            self._m[i][j] = value
+
+    @classmethod
+    def _like(cls, rows: Sequence[Sequence[T]], storage: str) -> "Matrix[T]":
+        """Build a result matrix, keeping array storage when the values allow it."""
+        if storage == "array" and _array_typecode(chain.from_iterable(rows)) is not None:
+            return cls(rows, storage = "array")
+        return cls(rows)
 
 
     # Helpers
@@ -25,28 +301,160 @@ class Matrix(Generic[T]):
 
     def shape(self) -> tuple[int, int]: return self._shape
 
+    @property
+    def storage(self) -> str:
+        return "list" if self._buf is None else "array"
+
+    @property
+    def dtype(self) -> str:
+        """Cached element-type tag (one of DTYPES) so kernels dispatch once per call.
+
+        Reset by __setitem__ and the mutating operators; writing through a raw
+        row (mat[i][j] = x) bypasses it, use mat[i, j] = x instead. A list-backed
+        view reuses its owner's tag when homogeneous and never caches its own.
+        """
+        if self._base is not None and self._dtype is None:
+            tag = self._base.dtype
+            return tag if tag != "mixed" else _dtype_of(chain.from_iterable(self._m))
+        if self._dtype is None:
+            self._dtype = _dtype_of(chain.from_iterable(self._m))
+        return self._dtype
+
+    @property
+    def strides(self) -> tuple[int, int]:
+        """(row, column) strides in elements of the owner's row-major layout."""
+        return self._strides
+
+    @property
+    def is_view(self) -> bool:
+        return self._base is not None
+
+    def _touch(self) -> None:
+        """Drop cached dtype tags after a write (the owner's too, for a view)."""
+        if self._buf is None:
+            self._dtype = None
+            if self._base is not None:
+                self._base._dtype = None
+
+    def _rows_copy(self) -> List[List[T]]:
+        """Return the rows as fresh Python lists (working copy for eliminations)."""
+        if self._buf is None:
+            return [list(r) for r in self._m]
+        return [r.tolist() for r in self._m]
+
+    def copy(self) -> "Matrix[T]":
+        """Materialize into a fresh owning matrix with the same storage. O(rows×cols)."""
+        return Matrix(self._rows_copy(), storage = self.storage)
+
+    def transpose_view(self) -> "Matrix[T]":
+        """Zero-copy Aᵀ over the same storage (strides swapped). O(cols) row handles."""
+        owner = self if self._base is None else self._base
+        rows, cols = self._shape
+        return Matrix._view(owner, self._origin, self._steps, (cols, rows), not self._transposed,
+                            self._conjugated)
+
+    def adjoint(self) -> "Matrix[T]":
+        """Zero-copy conjugate transpose Aᴴ: a transposed view whose entries are
+        conjugated on read (and on write). Real matrices get plain Aᵀ. O(cols)."""
+        if self._buf is not None or self.dtype in _REAL_TAGS:
+            return self.transpose_view()
+        owner = self if self._base is None else self._base
+        rows, cols = self._shape
+        return Matrix._view(owner, self._origin, self._steps, (cols, rows), not self._transposed,
+                            not self._conjugated)
+
+    def _columns(self) -> list:
+        """Columns as row-like sequences: free for a transposed view, else packed once.
+
+        Run proxies (strided or conjugating, list storage) rebuild the whole
+        run on every slice, so they are materialized here once instead of
+        once per panel in the kernels.
+        """
+        if self._transposed:
+            cols = self.transpose_view()._m
+            if self._buf is None and not all(isinstance(col, list) for col in cols):
+                return [col.tolist() for col in cols]
+            return cols
+        return [list(col) for col in zip(*self._m)]
+
+    def _slice_view(self, rows, cols) -> "Matrix[T]":
+        """View of the block selected by two int/slice indices (positive steps only)."""
+        ranges = []
+        for key, size in ((rows, self._shape[0]), (cols, self._shape[1])):
+            if isinstance(key, int):
+                i = key + size if key < 0 else key
+                if not 0 <= i < size:
+                    raise IndexError("Matrix index out of range")
+                key = slice(i, i + 1)
+            r = range(*key.indices(size))
+            if r.step <= 0:
+                raise ValueError("Matrix views need a positive slice step")
+            if not r:
+                raise ValueError("Matrix cannot be empty")
+            ranges.append(r)
+        rr, cr = ranges
+        (r0, c0), (rs, cs) = self._origin, self._steps
+        if self._transposed: # view rows walk owner columns and vice versa
+            origin, steps = (r0 + cr.start * rs, c0 + rr.start * cs), (rs * cr.step, cs * rr.step)
+        else:
+            origin, steps = (r0 + rr.start * rs, c0 + cr.start * cs), (rs * rr.step, cs * cr.step)
+        owner = self if self._base is None else self._base
+        return Matrix._view(owner, origin, steps, (len(rr), len(cr)), self._transposed, self._conjugated)
+
     def __getitem__(self, key):
         # mat[i, j]
         if isinstance(key, tuple) and len(key) == 2:
             r, c = key
+            if isinstance(r, slice) or isinstance(c, slice):
+                return self._slice_view(r, c) # mat[1:5, 2:], mat[:, j] -> strided view
             return self._m[r][c]
         # mat[i] -> return row
         elif isinstance(key, int):
             return self._m[key]
+        # mat[a:b] -> view of whole rows
+        elif isinstance(key, slice):
+            return self._slice_view(key, slice(None))
         else:
-            raise TypeError("Index must be int or (int, int)")
+            raise TypeError("Index must be int, slice or a pair of them")
 
     def __setitem__(self, key, value):
-        if isinstance(key, tuple) and len(key) == 2:
+        if isinstance(key, tuple) and len(key) == 2 and not any(isinstance(k, slice) for k in key):
             r, c = key
-            self._m[r][c] = value
+            self._put(r, c, value)
+            self._touch()
         elif isinstance(key, int):
-            self._m[key] = list(value)
+            row, value = self._m[key], list(value)
+            if len(value) != self._shape[1]:
+                raise ValueError("Row length mismatch")
+            # write in place so views over this row stay attached
+            if self._buf is not None:
+                try:
+                    row[:] = array(self._buf.typecode, value)
+                except (TypeError, OverflowError):
+                    if not self._widen(value):
+                        raise
+                    self[key] = value # again, on the widened storage
+                    return
+            elif isinstance(row, list):
+                row[:] = value
+            else:
+                for j, x in enumerate(value):
+                    row[j] = x
+            self._touch()
+        elif isinstance(key, (tuple, slice)):
+            # block assignment: mat[1:3, 2:] = other (Matrix or nested rows)
+            block = self[key]
+            src = value._m if isinstance(value, Matrix) else value
+            if len(src) != block._shape[0]:
+                raise ValueError("Block shape mismatch")
+            for i in range(block._shape[0]):
+                block[i] = src[i]
+            self._touch()
         else:
-            raise TypeError("Index must be int or (int, int)")
+            raise TypeError("Index must be int, slice or a pair of them")
 
     def __repr__(self) -> str:
-        return "Matrix([" + ",\n        ".join(map(str, self._m)) + "])"
+        return "Matrix([" + ",\n        ".join(str(list(r)) for r in self._m) + "])"
 
     def _check_same_shape(self, other: "Matrix[T]") -> None:
         if self._shape != other._shape:
@@ -62,41 +470,55 @@ class Matrix(Generic[T]):
 
         Complexity: O(n) where n=rows×cols.
         """
+        from vector import Vector
         r, c = self.shape()
-        return Vector([self[r_i, c_j] for r_i in range(r) for c_j in range(c)])
+        return Vector([self[r_i, c_j] for r_i in range(r) for c_j in range(c)], storage = self.storage)
 
 
 
     # Immutable operators
     def __add__(self, other: "Matrix[T]") -> "Matrix[T]":
+        if is_lazy():
+            return Expr.leaf(self) + other
+        if not isinstance(other, Matrix): # let e.g. SparseMatrix/Expr.__radd__ handle it
+            return NotImplemented
         self._check_same_shape(other)
-        return Matrix([[a + b for a, b in zip(r1, r2)]
-                       for r1, r2 in zip(self._m, other._m)])
+        return Matrix._like([[a + b for a, b in zip(r1, r2)]
+                             for r1, r2 in zip(self._m, other._m)], self.storage)
 
     def __sub__(self, other: "Matrix[T]") -> "Matrix[T]":
+        if is_lazy():
+            return Expr.leaf(self) - other
+        if not isinstance(other, Matrix): # let e.g. SparseMatrix/Expr.__rsub__ handle it
+            return NotImplemented
         self._check_same_shape(other)
-        return Matrix([[a - b for a, b in zip(r1, r2)]
-                       for r1, r2 in zip(self._m, other._m)])
+        return Matrix._like([[a - b for a, b in zip(r1, r2)]
+                             for r1, r2 in zip(self._m, other._m)], self.storage)
 
     def __mul__(self, k: T) -> "Matrix[T]":
-        return Matrix([[k * x for x in row] for row in self._m])
+        if is_lazy():
+            return Expr.leaf(self) * k
+        return Matrix._like([[k * x for x in row] for row in self._m], self.storage)
     __rmul__ = __mul__
 
 
     # Mutating operators
     def add(self, m: "Matrix[T]") -> None:
         self._check_same_shape(m)
+        self._touch()
         for i in range(self._shape[0]):
             for j in range(self._shape[1]):
-                self._m[i][j] += m._m[i][j]
+                self._put(i, j, self._m[i][j] + m._m[i][j])
 
     def sub(self, m: "Matrix[T]") -> None:
         self._check_same_shape(m)
+        self._touch()
         for i in range(self._shape[0]):
             for j in range(self._shape[1]):
-                self._m[i][j] -= m._m[i][j]
+                self._put(i, j, self._m[i][j] - m._m[i][j])
 
     def scl(self, k: T) -> None:
+        self._touch()
         for i in range(self._shape[0]):
             for j in range(self._shape[1]):
-                self._m[i][j] *= k
\ No newline at end of file
+                self._put(i, j, self._m[i][j] * k)
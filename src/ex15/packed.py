@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+from typing import TypeVar, Generic, Sequence, List, Callable
+from numbers import Number
+
+from vector import Vector
+from matrix import Matrix, _dtype_of
+
+T = TypeVar('T', bound = Number)
+
+KINDS = ("symmetric", "upper", "lower")
+_FLIP = {"symmetric": "symmetric", "upper": "lower", "lower": "upper"}
+
+
+def _start(i: int) -> int:
+    """Offset of stored row i: rows 0..i-1 hold 1 + 2 + … + i entries."""
+    return i * (i + 1) // 2
+
+
+class PackedMatrix(Generic[T]):
+    """Square symmetric or triangular matrix keeping only n(n+1)/2 entries.
+
+    One triangle T is stored row by row (row i holds T[i][0..i] at
+    data[i(i+1)/2 + j]); the kind says how it is read:
+      lower     : A[i][j] = T[i][j] for j ≤ i, zero above
+      upper     : A[i][j] = T[j][i] for j ≥ i, zero below (A = Tᵀ)
+      symmetric : A[i][j] = A[j][i] = T[max(i, j)][min(i, j)]
+    so transposing a triangular matrix only flips the kind.
+    """
+
+    def __init__(self, n: int, data: Sequence[T], kind: str = "symmetric", zero: T = 0) -> None:
+        if n <= 0: # 0×0 not allowed
+            raise ValueError("Matrix cannot be empty")
+        if kind not in KINDS:
+            raise ValueError(f"kind must be one of {KINDS}")
+        self._data: List[T] = list(data)
+        if len(self._data) != _start(n):
+            raise ValueError(f"Packed {n}×{n} matrix needs {_start(n)} entries")
+        self._n, self._kind, self._zero = n, kind, zero
+
+    @classmethod
+    def _from_packed(cls, n: int, data: List[T], kind: str, zero: T) -> "PackedMatrix[T]":
+        """Wrap an existing packed list without copying it."""
+        obj = cls.__new__(cls)
+        obj._n, obj._data, obj._kind, obj._zero = n, data, kind, zero
+        return obj
+
+    @classmethod
+    def from_matrix(cls, mat: Matrix[T], kind: str = "symmetric") -> "PackedMatrix[T]":
+        """Pack the triangle of a dense square Matrix that `kind` reads (the
+        lower one for symmetric); the other entries are ignored. O(n²)."""
+        n_rows, n_cols = mat.shape()
+        if n_rows != n_cols:
+            raise ValueError("Packed storage needs a square matrix")
+        rows = mat._m
+        if kind == "upper":
+            data = [rows[j][i] for i in range(n_rows) for j in range(i + 1)]
+        else:
+            data = [x for i, row in enumerate(rows) for x in row[:i + 1]]
+        return cls(n_rows, data, kind, rows[0][0] - rows[0][0])
+
+    @classmethod
+    def zeros(cls, n: int, kind: str = "symmetric", zero: T = 0) -> "PackedMatrix[T]":
+        return cls(n, [zero] * _start(n), kind, zero)
+
+    def to_matrix(self) -> Matrix[T]:
+        """Dense copy. O(n²)."""
+        return Matrix([self[i] for i in range(self._n)])
+
+    def lower_rows(self) -> List[List[T]]:
+        """Stored rows T[i][0..i] as ragged lists (row i of A when lower or
+        symmetric, column i of A when upper). O(n²) copy, no zero fill."""
+        data = self._data
+        return [data[_start(i):_start(i + 1)] for i in range(self._n)]
+
+
+    # Helpers
+    def __len__(self) -> int: return self._n  # nb rows
+
+    def shape(self) -> tuple[int, int]: return (self._n, self._n)
+
+    def is_square(self) -> bool:
+        return True
+
+    @property
+    def kind(self) -> str:
+        return self._kind
+
+    @property
+    def storage(self) -> str:
+        return "list"
+
+    @property
+    def dtype(self) -> str:
+        """Element-type tag of the stored entries (see matrix.DTYPES). O(n²)."""
+        return _dtype_of(self._data)
+
+    def _stored(self, i: int, j: int) -> T:
+        """A[i][j] read through the kind (zero outside a triangular one)."""
+        if self._kind == "upper":
+            i, j = j, i
+        if j > i:
+            if self._kind != "symmetric":
+                return self._zero
+            i, j = j, i
+        return self._data[_start(i) + j]
+
+    def __getitem__(self, key):
+        # mat[i, j] -> entry
+        if isinstance(key, tuple) and len(key) == 2:
+            r, c = key
+            if not (0 <= r < self._n and 0 <= c < self._n):
+                raise IndexError("Matrix index out of range")
+            return self._stored(r, c)
+        # mat[i] -> dense copy of the row
+        elif isinstance(key, int):
+            if not 0 <= key < self._n:
+                raise IndexError("Matrix index out of range")
+            return [self._stored(key, c) for c in range(self._n)]
+        else:
+            raise TypeError("Index must be int or (int, int)")
+
+    def __repr__(self) -> str:
+        rows = ",\n              ".join(str(self[i]) for i in range(self._n))
+        return f"PackedMatrix({self._kind}, [{rows}])"
+
+    def _check_same_layout(self, other: "PackedMatrix[T]") -> None:
+        if self._n != other._n or self._kind != other._kind:
+            raise ValueError("Packed matrices must have the same size and kind")
+
+
+    # Immutable operators (entry by entry on the packed lists)
+    def __add__(self, other: "PackedMatrix[T]") -> "PackedMatrix[T]":
+        self._check_same_layout(other)
+        return PackedMatrix._from_packed(self._n, [a + b for a, b in zip(self._data, other._data)],
+                                         self._kind, self._zero)
+
+    def __sub__(self, other: "PackedMatrix[T]") -> "PackedMatrix[T]":
+        self._check_same_layout(other)
+        return PackedMatrix._from_packed(self._n, [a - b for a, b in zip(self._data, other._data)],
+                                         self._kind, self._zero)
+
+    def __mul__(self, k: T) -> "PackedMatrix[T]":
+        return PackedMatrix._from_packed(self._n, [a * k for a in self._data], self._kind, self._zero)
+    __rmul__ = __mul__
+
+
+def packed_transpose(mat: PackedMatrix[T]) -> PackedMatrix[T]:
+    """Return Aᵀ: mat itself when symmetric, else the same packed list read
+    with the other triangular kind (nothing is copied).
+
+    Time complexity  : O(1)
+    Space complexity : O(1)
+    """
+    if mat._kind == "symmetric":
+        return mat
+    return PackedMatrix._from_packed(mat._n, mat._data, _FLIP[mat._kind], mat._zero)
+
+
+def packed_trace(mat: PackedMatrix[T]) -> T:
+    """Return the sum of the n stored diagonal entries.
+
+    Time complexity: Θ(n); Space complexity: Θ(1).
+    """
+    data = mat._data
+    acc: T = mat._zero
+    for i in range(mat._n):
+        acc += data[_start(i) + i]
+    return acc
+
+
+def packed_determinant(mat: PackedMatrix[T]) -> T:
+    """Return det(A) of a triangular A as the product of its diagonal.
+
+    Time complexity: Θ(n); Space complexity: Θ(1).
+    """
+    if mat._kind == "symmetric":
+        raise ValueError("Diagonal product is the determinant of triangular matrices only")
+    data = mat._data
+    acc: T = data[0]
+    for i in range(1, mat._n):
+        acc *= data[_start(i) + i]
+    return acc
+
+
+def packed_mat_vec_mul(mat: PackedMatrix[T], u: Vector[T]) -> Vector[T]:
+    """Return A·u reading every stored entry once.
+
+    Lower: y[i] = T[i][:i+1]·u[:i+1]. Upper: stored row j is column j of A,
+    added as u[j]·T[j][:j+1] into y[:j+1]. Symmetric: both at once, each
+    off-diagonal entry serving A[i][j] and A[j][i].
+
+    Time complexity  : Θ(n²/2) multiply-adds for a triangular A, Θ(n²) symmetric
+    Space complexity : Θ(n) (result vector)
+    """
+    n = mat._n
+    if len(u) != n:
+        raise ValueError("Dimension mismatch in matrix–vector product")
+    x = list(u)
+    zero: T = x[0] - x[0]
+    y = [zero] * n
+    for i, row in enumerate(mat.lower_rows()):
+        if mat._kind != "upper": # row i of A, left of the diagonal included
+            acc = zero
+            for a, b in zip(row, x):
+                acc += a * b
+            y[i] += acc
+        if mat._kind != "lower": # column i of A, above the diagonal (included when upper)
+            xi = x[i]
+            for j in range(i if mat._kind == "symmetric" else i + 1):
+                y[j] += row[j] * xi
+    return Vector._like(y, u.storage)
+
+
+def _substitute(mat: PackedMatrix[T], b: List[T]) -> List[T]:
+    """Solve A·x = b for a triangular A, one contiguous stored row per step.
+
+    Lower: forward substitution, x[i] = (b[i] − T[i][:i]·x[:i]) / T[i][i].
+    Upper: column-oriented back substitution, stored row j being column j
+    of A: x[j] = b[j] / A[j][j], then b[:j] −= x[j]·A[:j][j].
+    """
+    n, data = mat._n, mat._data
+    x = list(b)
+    steps = range(n) if mat._kind == "lower" else range(n - 1, -1, -1)
+    for i in steps:
+        lo = _start(i)
+        d = data[lo + i]
+        if d == 0:
+            raise ValueError("Matrix is singular (zero on the diagonal)")
+        if mat._kind == "lower":
+            acc = x[i]
+            for a, v in zip(data[lo:lo + i], x):
+                acc -= a * v
+            x[i] = acc / d
+        else:
+            xi = x[i] = x[i] / d
+            for j, a in enumerate(data[lo:lo + i]):
+                x[j] -= a * xi
+    return x
+
+
+def packed_triangular_solve(mat: PackedMatrix[T], b: Vector[T] | Matrix[T]) -> Vector[T] | Matrix[T]:
+    """Solve A·x = b (Vector) or A·X = B (Matrix, one right-hand side per
+    column) for a triangular A by substitution; no factorization is needed.
+
+    Time complexity  : Θ(n²/2) multiply-adds per right-hand side
+    Space complexity : Θ(n·k) for k right-hand sides
+    """
+    if mat._kind == "symmetric":
+        raise ValueError("Substitution needs an upper or lower triangular matrix")
+    n = mat._n
+    if isinstance(b, Vector):
+        if len(b) != n:
+            raise ValueError("Dimension mismatch in solve")
+        return Vector._like(_substitute(mat, list(b)), b.storage)
+    if b.shape()[0] != n:
+        raise ValueError("Dimension mismatch in solve")
+    columns = [_substitute(mat, list(col)) for col in zip(*b._m)]
+    return Matrix._like([list(row) for row in zip(*columns)], b.storage)
+
+
+def packed_inverse(mat: PackedMatrix[T]) -> PackedMatrix[T]:
+    """Return A⁻¹ of a triangular A, packed with the same kind.
+
+    Column c of L⁻¹ (lower) is zero above row c, so each solve starts at
+    the diagonal; an upper A is inverted as (Aᵀ)⁻¹ transposed.
+
+    Time complexity  : Θ(n³/6) multiply-adds
+    Space complexity : Θ(n²/2) for the result
+    """
+    if mat._kind == "symmetric":
+        raise ValueError("Substitution needs an upper or lower triangular matrix")
+    n, data, zero = mat._n, mat._data, mat._zero
+    inv: List[T] = [zero] * _start(n) # packed lower triangle of L⁻¹, L = A or Aᵀ
+    for c in range(n):
+        # Forward substitution on L·x = e_c, rows c..n-1 only
+        for i in range(c, n):
+            lo = _start(i)
+            acc = zero + 1 if i == c else zero
+            for j in range(c, i):
+                acc -= data[lo + j] * inv[_start(j) + c]
+            d = data[lo + i]
+            if d == 0:
+                raise ValueError("Matrix is singular (zero on the diagonal)")
+            inv[lo + c] = acc / d
+    return PackedMatrix._from_packed(n, inv, mat._kind, zero)
+
+
+def packed_syrk(alpha: T, rows: Sequence[Sequence[T]], beta: T, out: PackedMatrix[T],
+                dotk: Callable) -> None:
+    """C ← α·R·Rᵀ + β·C on a symmetric packed C, R given as its rows.
+
+    Only the n(n+1)/2 entries of the lower triangle are computed (one dot
+    product each), half of the n² a general product would form.
+
+    Time complexity  : Θ(n²k/2) for n rows of length k
+    Space complexity : Θ(1) extra (C is updated in place)
+    """
+    if out._kind != "symmetric":
+        raise ValueError("syrk writes a symmetric matrix")
+    if len(rows) != out._n:
+        raise ValueError(f"out has shape {out.shape()}, expected {(len(rows), len(rows))}")
+    data, zero = out._data, out._zero
+    k = 0
+    for i, ri in enumerate(rows):
+        for j in range(i + 1):
+            v = dotk(ri, rows[j])
+            if alpha != 1:
+                v = alpha * v
+            data[k] = v + zero if beta == 0 else v + beta * data[k]
+            k += 1
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import sys
+import sysconfig
+from array import array
+from contextlib import contextmanager
+from itertools import chain
+from math import ceil
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Iterator, List
+
+PARALLEL_MIN_FLOPS = 1 << 21 # smallest m·n·p worth a process pool (~128³)
+THREAD_MIN_FLOPS = 1 << 15 # smallest job worth handing to threads (free-threaded builds only)
+_CHUNKS_PER_WORKER = 2 # row blocks per worker, evens out uneven finish times
+
+_DOUBLE = array("d").itemsize
+
+
+def _shared_doubles(values, count: int) -> SharedMemory:
+    """New shared segment holding `count` doubles, filled from values."""
+    shm = SharedMemory(create = True, size = count * _DOUBLE)
+    view = shm.buf.cast("d")
+    view[:count] = array("d", values)
+    view.release()
+    return shm
+
+
+def _attach(name: str) -> SharedMemory:
+    """Open a segment created by the parent (pool workers share its resource
+    tracker, so the parent's unlink is the only cleanup needed)."""
+    return SharedMemory(name = name)
+
+
+# Worker side: operands attached once per process by the pool initializer
+_worker: dict = {}
+
+
+def _init_matmul_worker(names: tuple, m: int, n: int, p: int, block: int, dotk: Callable) -> None:
+    segments = [_attach(name) for name in names]
+    a, bt, c = (shm.buf.cast("d") for shm in segments)
+    _worker.update(segments = segments, c = c, p = p, block = block, dotk = dotk,
+                   a_rows = [a[i * n:(i + 1) * n] for i in range(m)],
+                   b_cols = [bt[j * n:(j + 1) * n] for j in range(p)],
+                   k_starts = range(0, n, block))
+
+
+def _matmul_rows_worker(bounds: tuple[int, int]) -> None:
+    """C[i0:i1] = A[i0:i1]·B, panel by panel along k like the serial blocked kernel."""
+    w = _worker
+    c, p, block, dotk = w["c"], w["p"], w["block"], w["dotk"]
+    for i in range(*bounds):
+        a = w["a_rows"][i]
+        base = i * p
+        for j, b in enumerate(w["b_cols"]):
+            acc = 0.0
+            for kk in w["k_starts"]:
+                acc += dotk(a[kk:kk + block], b[kk:kk + block])
+            c[base + j] = acc
+
+
+def _init_rows_worker(name: str, m: int, n: int) -> None:
+    shm = _attach(name)
+    view = shm.buf.cast("d")
+    _worker.update(segments = [shm], rows = [view[i * n:(i + 1) * n] for i in range(m)])
+
+
+def _rows_task_worker(task: tuple) -> None:
+    fn, args = task
+    fn(_worker["rows"], *args)
+
+
+@contextmanager
+def shared_rows(rows, n: int, processes: int) -> Iterator[tuple[list, Callable]]:
+    """Move float rows into one shared segment served by a process pool.
+
+    Yields (views, run): views[i] is a writable memoryview of row i (copy the
+    values out before the block ends), and run(fn, tasks) calls
+    fn(worker_rows, *task) in the pool for every task, worker_rows being the
+    workers' views of the same rows in the same order. Workers attach once,
+    so each task only pickles its own arguments.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    m = len(rows)
+    shm = _shared_doubles(chain.from_iterable(rows), m * n)
+    view = shm.buf.cast("d")
+    views = [view[i * n:(i + 1) * n] for i in range(m)]
+    try:
+        with ProcessPoolExecutor(max_workers = processes, initializer = _init_rows_worker,
+                                 initargs = (shm.name, m, n)) as pool:
+            def run(fn: Callable, tasks: List[tuple]) -> None:
+                for _ in pool.map(_rows_task_worker, [(fn, task) for task in tasks]):
+                    pass
+            yield views, run
+    finally:
+        for v in views:
+            v.release()
+        view.release()
+        shm.close()
+        shm.unlink()
+
+
+def worth_parallel(flops: int, workers: int | None) -> bool:
+    """True when more than one worker is asked for and the job is big enough."""
+    return workers is not None and workers > 1 and flops >= PARALLEL_MIN_FLOPS
+
+
+def row_chunks(m: int, workers: int) -> List[tuple[int, int]]:
+    """Split range(m) into contiguous (start, stop) blocks for `workers`."""
+    size = max(1, ceil(m / (workers * _CHUNKS_PER_WORKER)))
+    return [(i, min(i + size, m)) for i in range(0, m, size)]
+
+
+def parallel_mat_mat_mul(rows1, cols2, m: int, n: int, p: int, block: int,
+                         dotk: Callable, processes: int) -> array:
+    """Float A·B with output row blocks spread over a process pool; flat m·p result.
+
+    A and Bᵀ are copied once into shared memory and the workers write C in
+    place, so nothing is pickled but the segment names and row bounds. Every
+    C[i][j] is accumulated panel by panel exactly as in the serial kernel,
+    so the result is bit-identical for any worker count.
+
+    Time complexity  : O(mnp / processes) + O(mn + np) packing
+    Space complexity : O(mn + np + mp) shared
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    segments = [_shared_doubles(chain.from_iterable(rows1), m * n),
+                _shared_doubles(chain.from_iterable(cols2), n * p),
+                SharedMemory(create = True, size = m * p * _DOUBLE)] # C, written by the workers
+    try:
+        names = tuple(shm.name for shm in segments)
+        with ProcessPoolExecutor(max_workers = processes, initializer = _init_matmul_worker,
+                                 initargs = (names, m, n, p, block, dotk)) as pool:
+            for _ in pool.map(_matmul_rows_worker, row_chunks(m, processes)):
+                pass
+        view = segments[2].buf.cast("d")
+        result = array("d", view[:m * p])
+        view.release()
+        return result
+    finally:
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+
+def free_threaded() -> bool:
+    """True on a CPython build running without the GIL (3.13t and later)."""
+    if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+        return False
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled() # PYTHON_GIL=1 re-enables it
+
+
+@contextmanager
+def thread_map(threads: int | None) -> Iterator[Callable]:
+    """Yield run(fn, m, flops): fn over row blocks (start, stop) covering range(m).
+
+    The blocks go to a thread pool only on a free-threaded interpreter, with
+    more than one thread, for jobs of at least THREAD_MIN_FLOPS; otherwise fn
+    gets the single block (0, m). Callers write disjoint rows and every
+    element is computed by the same code either way, so results are
+    bit-identical to the serial path. One pool serves the whole `with` block.
+    """
+    if threads is None or threads <= 1 or not free_threaded():
+        yield lambda fn, m, flops: fn((0, m))
+        return
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers = threads) as pool:
+        def run(fn: Callable, m: int, flops: int) -> None:
+            if flops < THREAD_MIN_FLOPS:
+                fn((0, m))
+            else:
+                for _ in pool.map(fn, row_chunks(m, threads)):
+                    pass
+        yield run
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from typing import Sequence, Iterable
+from array import array
+from operator import add, sub
+
+from complex import Complex
+from vector import Vector
+from matrix import Matrix
+from sumprod import _sumprod as _dot
+
+
+def _split(values: Iterable) -> tuple[array, array]:
+    """Real and imaginary parts of complex-like values as two array('d')."""
+    values = list(values)
+    return array("d", [x.real for x in values]), array("d", [x.imag for x in values])
+
+
+class ComplexVector:
+    """Complex vector stored as two parallel float buffers (structure of arrays).
+
+    No per-element Python object exists until an entry is read: kernels work
+    on the re / im arrays with C-level float loops.
+    """
+
+    def __init__(self, data: Sequence) -> None:
+        if not data: # empty vector not allowed
+            raise ValueError("Vector cannot be empty")
+        self._re, self._im = _split(data)
+
+    @classmethod
+    def _from_parts(cls, re: array, im: array) -> "ComplexVector":
+        obj = cls.__new__(cls)
+        obj._re, obj._im = re, im
+        return obj
+
+    @classmethod
+    def from_vector(cls, v: Vector) -> "ComplexVector":
+        return cls(v._data)
+
+    def to_vector(self) -> Vector[Complex]:
+        """Vector of Complex entries. O(n)."""
+        return Vector(list(self))
+
+
+    # Helpers
+    def __len__(self) -> int: return len(self._re)
+
+    def __getitem__(self, i: int) -> Complex: return Complex(self._re[i], self._im[i])
+
+    def __iter__(self): return map(Complex, self._re, self._im)
+
+    def __repr__(self) -> str: return f"ComplexVector({list(self)})"
+
+    def _check_same_size(self, other: "ComplexVector") -> None:
+        if len(self) != len(other):
+            raise ValueError("Vector size mismatch")
+
+
+    # Immutable operators
+    def __add__(self, other: "ComplexVector") -> "ComplexVector":
+        self._check_same_size(other)
+        return ComplexVector._from_parts(array("d", map(add, self._re, other._re)),
+                                         array("d", map(add, self._im, other._im)))
+
+    def __sub__(self, other: "ComplexVector") -> "ComplexVector":
+        self._check_same_size(other)
+        return ComplexVector._from_parts(array("d", map(sub, self._re, other._re)),
+                                         array("d", map(sub, self._im, other._im)))
+
+    def __mul__(self, k) -> "ComplexVector":
+        return ComplexVector._from_parts(*_scale(self._re, self._im, k))
+    __rmul__ = __mul__
+
+
+class ComplexMatrix:
+    """Complex matrix stored as two row-major float buffers (structure of arrays).
+
+    Entry (i, j) is re[i·cols + j] + i·im[i·cols + j]; products are computed
+    on the real parts with the 3M (Gauss) method.
+    """
+
+    def __init__(self, rows: Sequence[Sequence]) -> None:
+        if not rows: # 0×0 not allowed
+            raise ValueError("Matrix cannot be empty")
+        row_lengths = {len(r) for r in rows}
+        if len(row_lengths) != 1:
+            raise ValueError("All rows must have the same length")
+        self._shape = (len(rows), len(rows[0])) # (rows, cols)
+        self._re, self._im = _split(x for row in rows for x in row)
+
+    @classmethod
+    def _from_parts(cls, shape: tuple[int, int], re: array, im: array) -> "ComplexMatrix":
+        obj = cls.__new__(cls)
+        obj._shape, obj._re, obj._im = shape, re, im
+        return obj
+
+    @classmethod
+    def from_matrix(cls, mat: Matrix) -> "ComplexMatrix":
+        return cls(mat._m)
+
+    def to_matrix(self) -> Matrix[Complex]:
+        """Matrix of Complex entries. O(rows×cols)."""
+        return Matrix([self[i] for i in range(self._shape[0])])
+
+
+    # Helpers
+    def __len__(self) -> int: return self._shape[0]  # nb rows
+
+    def shape(self) -> tuple[int, int]: return self._shape
+
+    def is_square(self) -> bool:
+        """Return True if matrix is square."""
+        rows, cols = self.shape()
+        return rows == cols
+
+    def __getitem__(self, key):
+        cols = self._shape[1]
+        # mat[i, j] -> Complex
+        if isinstance(key, tuple) and len(key) == 2:
+            r, c = key
+            k = r * cols + c
+            return Complex(self._re[k], self._im[k])
+        # mat[i] -> list of Complex
+        elif isinstance(key, int):
+            lo = key * cols
+            return list(map(Complex, self._re[lo:lo + cols], self._im[lo:lo + cols]))
+        else:
+            raise TypeError("Index must be int or (int, int)")
+
+    def __repr__(self) -> str:
+        return "ComplexMatrix([" + ",\n               ".join(str(self[i]) for i in range(self._shape[0])) + "])"
+
+    def _check_same_shape(self, other: "ComplexMatrix") -> None:
+        if self._shape != other.shape():
+            raise ValueError("Matrix shape mismatch")
+
+
+    # Immutable operators
+    def __add__(self, other: "ComplexMatrix") -> "ComplexMatrix":
+        self._check_same_shape(other)
+        return ComplexMatrix._from_parts(self._shape, array("d", map(add, self._re, other._re)),
+                                         array("d", map(add, self._im, other._im)))
+
+    def __sub__(self, other: "ComplexMatrix") -> "ComplexMatrix":
+        self._check_same_shape(other)
+        return ComplexMatrix._from_parts(self._shape, array("d", map(sub, self._re, other._re)),
+                                         array("d", map(sub, self._im, other._im)))
+
+    def __mul__(self, k) -> "ComplexMatrix":
+        return ComplexMatrix._from_parts(self._shape, *_scale(self._re, self._im, k))
+    __rmul__ = __mul__
+
+
+def _as_vector(u) -> ComplexVector:
+    """u itself, or a plain Vector copied into split buffers."""
+    if isinstance(u, ComplexVector):
+        return u
+    if isinstance(u, Vector):
+        return ComplexVector.from_vector(u)
+    raise TypeError(f"Cannot combine a ComplexVector with {type(u).__name__}")
+
+
+def _as_matrix(mat) -> ComplexMatrix:
+    """mat itself, or a plain Matrix copied into split buffers."""
+    if isinstance(mat, ComplexMatrix):
+        return mat
+    if isinstance(mat, Matrix):
+        return ComplexMatrix.from_matrix(mat)
+    raise TypeError(f"Cannot combine a ComplexMatrix with {type(mat).__name__}")
+
+
+def _scale(re: array, im: array, k) -> tuple[array, array]:
+    """(re + i·im)·k for a real or complex scalar k, part by part."""
+    kr, ki = k.real, k.imag
+    if ki == 0:
+        return array("d", [x * kr for x in re]), array("d", [y * kr for y in im])
+    return (array("d", [x * kr - y * ki for x, y in zip(re, im)]),
+            array("d", [x * ki + y * kr for x, y in zip(re, im)]))
+
+
+def _real_mat_mul(a: array, b: array, m: int, n: int, p: int) -> array:
+    """Row-major real product (m×n)·(n×p): every entry is one C-level sumprod."""
+    rows = [a[i * n:(i + 1) * n] for i in range(m)]
+    cols = [b[j::p] for j in range(p)] # strided slices: B's columns, packed once
+    return array("d", [_dot(r, c) for r in rows for c in cols])
+
+
+def _gauss3m(ar: array, ai: array, br: array, bi: array, product) -> tuple[array, array]:
+    """3M: (Ar + iAi)(Br + iBi) from three real products instead of four.
+
+    T1 = Ar·Br, T2 = Ai·Bi, T3 = (Ar + Ai)(Br + Bi);
+    re = T1 − T2, im = T3 − T1 − T2.
+    """
+    t1 = product(ar, br)
+    t2 = product(ai, bi)
+    t3 = product(array("d", map(add, ar, ai)), array("d", map(add, br, bi)))
+    return array("d", map(sub, t1, t2)), array("d", map(sub, map(sub, t3, t1), t2))
+
+
+def soa_mat_mat_mul(mat1: ComplexMatrix, mat2: ComplexMatrix) -> ComplexMatrix:
+    """Return A·B with the 3M method on the split real / imaginary buffers.
+
+    Three real products replace the four of the schoolbook formula (25%
+    fewer multiplications); no Complex object is created. The rounding
+    differs slightly from the 4-product formula (im = T3 − T1 − T2).
+
+    A plain Matrix operand is converted first (O(size) copy).
+
+    Time complexity  : 3·O(mnp) real multiply-adds
+    Space complexity : O(mn + np + mp)
+    """
+    mat1, mat2 = _as_matrix(mat1), _as_matrix(mat2)
+    m, n = mat1.shape()
+    n2, p = mat2.shape()
+    if n != n2:
+        raise ValueError("Inner dimensions do not match for A·B")
+    re, im = _gauss3m(mat1._re, mat1._im, mat2._re, mat2._im,
+                      lambda a, b: _real_mat_mul(a, b, m, n, p))
+    return ComplexMatrix._from_parts((m, p), re, im)
+
+
+def soa_mat_vec_mul(mat: ComplexMatrix, u: ComplexVector) -> ComplexVector:
+    """Return A·u with the 3M method. O(rows×cols) real multiply-adds ×3.
+    A plain Matrix / Vector operand is converted first."""
+    mat, u = _as_matrix(mat), _as_vector(u)
+    m, n = mat.shape()
+    if len(u) != n:
+        raise ValueError("Dimension mismatch in matrix–vector product")
+    re, im = _gauss3m(mat._re, mat._im, u._re, u._im,
+                      lambda a, b: _real_mat_mul(a, b, m, n, 1))
+    return ComplexVector._from_parts(re, im)
+
+
+def soa_dot(u: ComplexVector, v: ComplexVector) -> Complex:
+    """Return ⟨u|v⟩ = Σ conj(u_i)·v_i from four real sumprods (no per-element objects).
+
+    A plain Vector operand is converted first (Θ(n) copy).
+
+    Time complexity: Θ(n); Space complexity: Θ(1).
+    """
+    u, v = _as_vector(u), _as_vector(v)
+    u._check_same_size(v)
+    ur, ui, vr, vi = u._re, u._im, v._re, v._im
+    return Complex(_dot(ur, vr) + _dot(ui, vi), _dot(ur, vi) - _dot(ui, vr))
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+from typing import TypeVar, Generic, Sequence, List, Iterable
+from numbers import Number
+from array import array
+from bisect import bisect_left
+
+from vector import Vector
+from matrix import Matrix
+
+T = TypeVar('T', bound = Number)
+
+
+class SparseMatrix(Generic[T]):
+    """Compressed sparse row (CSR) matrix: only non-zero entries are stored.
+
+    Row i owns data[indptr[i]:indptr[i + 1]] at columns indices[...] (sorted),
+    so memory and kernel time scale with nnz instead of rows×cols.
+    """
+
+    def __init__(self, shape: tuple[int, int], indptr: Iterable[int],
+                 indices: Iterable[int], data: Iterable[T], zero: T = 0) -> None:
+        rows, cols = shape
+        if rows <= 0 or cols <= 0: # 0×0 not allowed
+            raise ValueError("Matrix cannot be empty")
+        self._shape = (rows, cols)
+        self._indptr = array("q", indptr)
+        self._indices = array("q", indices)
+        self._data: List[T] = list(data)
+        self._zero = zero
+        if len(self._indptr) != rows + 1 or len(self._indices) != len(self._data):
+            raise ValueError("Inconsistent CSR arrays")
+
+    @classmethod
+    def from_coo(cls, shape: tuple[int, int], row_idx: Sequence[int],
+                 col_idx: Sequence[int], values: Sequence[T]) -> "SparseMatrix[T]":
+        """COO builder: (row, col, value) triplets in any order, duplicates summed.
+
+        Complexity: O(nnz log nnz) for the sort.
+        """
+        if not (len(row_idx) == len(col_idx) == len(values)):
+            raise ValueError("COO arrays must have the same length")
+        rows, cols = shape
+        merged = {}
+        for r, c, v in zip(row_idx, col_idx, values):
+            if not (0 <= r < rows and 0 <= c < cols):
+                raise IndexError("COO index out of range")
+            merged[r, c] = merged[r, c] + v if (r, c) in merged else v
+        zero = values[0] - values[0] if values else 0
+        indptr = [0] * (rows + 1)
+        indices, data = [], []
+        for (r, c) in sorted(merged):
+            v = merged[r, c]
+            if v != 0:
+                indptr[r + 1] += 1
+                indices.append(c)
+                data.append(v)
+        for r in range(rows):
+            indptr[r + 1] += indptr[r]
+        return cls(shape, indptr, indices, data, zero)
+
+    @classmethod
+    def from_matrix(cls, mat: Matrix[T]) -> "SparseMatrix[T]":
+        """Keep the non-zero entries of a dense Matrix. O(rows×cols)."""
+        indptr, indices, data = [0], [], []
+        for row in mat._m:
+            for c, x in enumerate(row):
+                if x != 0:
+                    indices.append(c)
+                    data.append(x)
+            indptr.append(len(data))
+        return cls(mat.shape(), indptr, indices, data, mat[0][0] - mat[0][0])
+
+    def to_matrix(self) -> Matrix[T]:
+        """Dense copy. O(rows×cols)."""
+        rows, cols = self._shape
+        out = [[self._zero] * cols for _ in range(rows)]
+        for i, row in enumerate(out):
+            for k in range(self._indptr[i], self._indptr[i + 1]):
+                row[self._indices[k]] = self._data[k]
+        return Matrix(out)
+
+    def _row_items(self, i: int) -> Iterable[tuple[int, T]]:
+        lo, hi = self._indptr[i], self._indptr[i + 1]
+        return zip(self._indices[lo:hi], self._data[lo:hi])
+
+
+    # Helpers
+    def __len__(self) -> int: return self._shape[0]  # nb rows
+
+    def shape(self) -> tuple[int, int]: return self._shape
+
+    @property
+    def nnz(self) -> int:
+        return len(self._data)
+
+    def is_square(self) -> bool:
+        """Return True if matrix is square."""
+        rows, cols = self.shape()
+        return rows == cols
+
+    def __getitem__(self, key):
+        # mat[i, j] -> binary search in row i
+        if isinstance(key, tuple) and len(key) == 2:
+            r, c = key
+            lo, hi = self._indptr[r], self._indptr[r + 1]
+            k = bisect_left(self._indices, c, lo, hi)
+            return self._data[k] if k < hi and self._indices[k] == c else self._zero
+        # mat[i] -> dense copy of the row
+        elif isinstance(key, int):
+            row = [self._zero] * self._shape[1]
+            for c, x in self._row_items(key):
+                row[c] = x
+            return row
+        else:
+            raise TypeError("Index must be int or (int, int)")
+
+    def __repr__(self) -> str:
+        entries = ", ".join(f"({i}, {c}): {x}" for i in range(self._shape[0]) for c, x in self._row_items(i))
+        return f"SparseMatrix(shape={self._shape}, {{{entries}}})"
+
+    def _check_same_shape(self, other) -> None:
+        if self._shape != other.shape():
+            raise ValueError("Matrix shape mismatch")
+
+
+    # Immutable operators
+    def _merge(self, other: "SparseMatrix[T]", sign: int) -> "SparseMatrix[T]":
+        """Row-wise merge of the stored entries; explicit zeros are dropped."""
+        indptr, indices, data = [0], [], []
+        for i in range(self._shape[0]):
+            acc = dict(self._row_items(i))
+            for c, x in other._row_items(i):
+                if c in acc:
+                    acc[c] = acc[c] + x if sign > 0 else acc[c] - x
+                else:
+                    acc[c] = x if sign > 0 else -x
+            for c in sorted(acc):
+                if acc[c] != 0:
+                    indices.append(c)
+                    data.append(acc[c])
+            indptr.append(len(data))
+        return SparseMatrix(self._shape, indptr, indices, data, self._zero)
+
+    def __add__(self, other):
+        self._check_same_shape(other)
+        if isinstance(other, SparseMatrix):
+            return self._merge(other, 1)
+        dense = other._rows_copy() # Matrix operand: dense result
+        for i, row in enumerate(dense):
+            for c, x in self._row_items(i):
+                row[c] = x + row[c]
+        return Matrix(dense)
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        self._check_same_shape(other)
+        if isinstance(other, SparseMatrix):
+            return self._merge(other, -1)
+        dense = [[-x for x in row] for row in other._rows_copy()] # no Matrix operator: eager even in lazy_mode()
+        for i, row in enumerate(dense):
+            for c, x in self._row_items(i):
+                row[c] = x + row[c]
+        return Matrix(dense)
+
+    def __rsub__(self, other):
+        return self * -1 + other
+
+    def __mul__(self, k: T) -> "SparseMatrix[T]":
+        return SparseMatrix(self._shape, self._indptr, self._indices,
+                            [k * x for x in self._data], self._zero)
+    __rmul__ = __mul__
+
+
+    # Mutating operators
+    def scl(self, k: T) -> None:
+        self._data = [x * k for x in self._data]
+
+
+def sparse_mat_vec_mul(mat: SparseMatrix[T], u: Vector[T], out: Vector[T] | None = None) -> Vector[T]:
+    """Return A·u touching only the stored entries (written into `out` if given).
+
+    Time complexity  : O(nnz + rows)
+    Space complexity : O(rows)  (result vector)
+    """
+    rows, cols = mat.shape()
+    if len(u) != cols:
+        raise ValueError("Dimension mismatch in matrix–vector product")
+    if out is not None and (len(out) != rows or out is u):
+        raise ValueError("out must be a separate Vector of length rows")
+    zero: T = u[0] - u[0]
+    indptr, indices, data = mat._indptr, mat._indices, mat._data
+    vals = out._data if out is not None else [zero] * rows
+    for i in range(rows):
+        acc = zero
+        for k in range(indptr[i], indptr[i + 1]):
+            acc += data[k] * u[indices[k]]
+        vals[i] = acc
+    if out is not None:
+        out._touch()
+        return out
+    return Vector._like(vals, u.storage)
+
+
+def sparse_mat_mat_mul(mat1, mat2):
+    """Return A·B when A and/or B is a SparseMatrix.
+
+    Sparse·Sparse uses Gustavson's row-by-row algorithm and stays sparse;
+    a dense operand gives a dense Matrix.
+
+    Time complexity  : O(Σ_i Σ_{k∈row i of A} nnz(row k of B)) flops
+    Space complexity : O(nnz(C)) sparse, O(m·p) dense
+    """
+    m, n = mat1.shape()
+    n2, p = mat2.shape()
+    if n != n2:
+        raise ValueError("Inner dimensions do not match for A·B")
+
+    if isinstance(mat1, SparseMatrix) and isinstance(mat2, SparseMatrix):
+        indptr, indices, data = [0], [], []
+        for i in range(m):
+            acc = {}
+            for k, a in mat1._row_items(i):
+                for j, b in mat2._row_items(k):
+                    acc[j] = acc[j] + a * b if j in acc else a * b
+            for j in sorted(acc):
+                if acc[j] != 0:
+                    indices.append(j)
+                    data.append(acc[j])
+            indptr.append(len(data))
+        return SparseMatrix((m, p), indptr, indices, data, mat1._zero)
+
+    if isinstance(mat1, SparseMatrix): # sparse · dense: row axpy over B's rows
+        zero = mat2[0][0] - mat2[0][0]
+        out = []
+        for i in range(m):
+            acc = [zero] * p
+            for k, a in mat1._row_items(i):
+                acc = [x + a * b for x, b in zip(acc, mat2._m[k])]
+            out.append(acc)
+        return Matrix._like(out, mat2.storage)
+
+    # dense · sparse: scatter each a(i,k) into the stored entries of row k
+    zero = mat1[0][0] - mat1[0][0]
+    out = []
+    for row in mat1._m:
+        acc = [zero] * p
+        for k, a in enumerate(row):
+            if a == 0:
+                continue
+            for j, b in mat2._row_items(k):
+                acc[j] += a * b
+        out.append(acc)
+    return Matrix._like(out, mat1.storage)
+
+
+def sparse_transpose(mat: SparseMatrix[T]) -> SparseMatrix[T]:
+    """Return Aᵀ in CSR form (counting sort on column indices).
+
+    Time complexity  : O(nnz + rows + cols)
+    Space complexity : O(nnz + cols)
+    """
+    rows, cols = mat.shape()
+    counts = [0] * (cols + 1)
+    for c in mat._indices:
+        counts[c + 1] += 1
+    for c in range(cols):
+        counts[c + 1] += counts[c]
+    indptr = list(counts)
+    nxt = counts[:-1]
+    indices = [0] * mat.nnz
+    data = [None] * mat.nnz
+    for i in range(rows): # rows visited in order, so each output row stays sorted
+        for c, x in mat._row_items(i):
+            k = nxt[c]
+            indices[k] = i
+            data[k] = x
+            nxt[c] += 1
+    return SparseMatrix((cols, rows), indptr, indices, data, mat._zero)
+
+
+def sparse_trace(mat: SparseMatrix[T]) -> T:
+    """Return the sum of the stored diagonal entries.
+
+    Time complexity: O(rows · log(nnz per row)) via binary search.
+    """
+    if not mat.is_square():
+        raise ValueError("Matrix must be square")
+    acc: T = mat._zero
+    for i in range(mat.shape()[0]):
+        acc += mat[i, i]
+    return acc
@@ -0,0 +1,18 @@
+"""Inner-product primitives shared by the dense (all_previous) and SoA (soa) kernels."""
+from __future__ import annotations
+
+from functools import reduce
+from operator import add, mul
+import math
+
+
+def _sumprod_fallback(p, q):
+    return sum(map(mul, p, q))
+
+def _sumprod_generic(p, q):
+    """Inner product that never mixes in an int 0 (keeps Complex/custom types exact)."""
+    return reduce(add, map(mul, p, q))
+
+# math.sumprod (3.12+) accumulates float products in extended precision in C.
+_math_sumprod = getattr(math, "sumprod", None)
+_sumprod = _math_sumprod or _sumprod_fallback
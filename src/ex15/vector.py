@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from typing import TypeVar, Generic, Sequence, List, Iterable, TYPE_CHECKING
+from typing import TypeVar, Generic, Sequence, List, Iterable, Optional, TYPE_CHECKING
 from numbers import Number
+from array import array
+
+from lazy import Expr, is_lazy
+from matrix import STORAGES, _TYPECODE_DTYPE, _array_typecode, _dtype_of, _widened_typecode
 
 if TYPE_CHECKING: # static-type import, no runtime impact (to avoid circular import)
     from matrix import Matrix
@@ -9,8 +13,29 @@ if TYPE_CHECKING: # static-type import, no runtime impact (to avoid circular imp
 T = TypeVar('T', bound = Number)
 
 class Vector(Generic[T]):
-    def __init__(self, data: Sequence[T]) -> None:
-        self._data: List[T] = list(data)
+    def __init__(self, data: Sequence[T], storage: str = "list") -> None:
+        """Build a vector; storage="array" keeps a flat array('d')/array('q') buffer
+        (int64 widened to float64 by a float write, list storage for wider ints)."""
+        if storage not in STORAGES:
+            raise ValueError(f"storage must be one of {STORAGES}")
+        values = list(data)
+        self._dtype: Optional[str] = None # element-type tag, computed on first use
+        if storage == "array":
+            code = _array_typecode(values)
+            if code is None:
+                raise TypeError("array storage requires float or int64 elements")
+            self._data = array(code, values)
+            self._dtype = _TYPECODE_DTYPE[code]
+        else:
+            self._data: List[T] = values
+
+    @classmethod
+    def _like(cls, data: Iterable[T], storage: str) -> "Vector[T]":
+        """Build a result vector, keeping array storage when the values allow it."""
+        values = list(data)
+        if storage == "array" and _array_typecode(values) is not None:
+            return cls(values, storage = "array")
+        return cls(values)
 
     # Helpers
     def __len__(self) -> int: return len(self._data)
@@ -19,9 +44,47 @@ class Vector(Generic[T]):
 
     def __getitem__(self, i: int) -> T: return self._data[i]
 
-    def __setitem__(self, i: int, value: T) -> None: self._data[i] = value
-
-    def __repr__(self) -> str: return f"Vector({self._data})"
+    def __setitem__(self, i: int, value: T) -> None:
+        try:
+            self._data[i] = value
+        except (TypeError, OverflowError):
+            if not self._widen((value,)):
+                raise
+            self._data[i] = value
+        self._touch()
+
+    def _widen(self, values) -> bool:
+        """Re-store an int64 buffer so `values` fit (float64, or a list for ints
+        beyond int64). False when the storage is not int64 or would not change."""
+        data = self._data
+        if not isinstance(data, array) or data.typecode != "q":
+            return False
+        code = _widened_typecode(data, values)
+        if code == "q":
+            return False
+        if code == "d":
+            self._data, self._dtype = array("d", data), "float"
+        else:
+            self._data, self._dtype = data.tolist(), None
+        return True
+
+    def _touch(self) -> None:
+        """Drop the cached dtype tag after a write (array storage keeps its typecode)."""
+        if not isinstance(self._data, array):
+            self._dtype = None
+
+    def __repr__(self) -> str: return f"Vector({list(self._data)})"
+
+    @property
+    def storage(self) -> str:
+        return "array" if isinstance(self._data, array) else "list"
+
+    @property
+    def dtype(self) -> str:
+        """Cached element-type tag (see matrix.DTYPES), reset by __setitem__."""
+        if self._dtype is None:
+            self._dtype = _dtype_of(self._data)
+        return self._dtype
 
     def _check_same_size(self, other: "Vector[T]") -> None:
         if len(self) != len(other):
@@ -32,24 +95,31 @@ class Vector(Generic[T]):
 
         Complexity: O(n) where *n=len(vec).
         """
+        from matrix import Matrix
         if rows * cols != len(self):
             raise ValueError("Total element count mismatch in reshape.")
 
         it = iter(self)
-        return Matrix([[next(it) for _ in range(cols)] for _ in range(rows)])
+        return Matrix([[next(it) for _ in range(cols)] for _ in range(rows)], storage = self.storage)
 
 
     # Immutable operators
     def __add__(self, other: "Vector[T]") -> "Vector[T]":
+        if is_lazy() or isinstance(other, Expr):
+            return Expr.leaf(self) + other
         self._check_same_size(other)
-        return Vector(a + b for a, b in zip(self, other))
+        return Vector._like((a + b for a, b in zip(self, other)), self.storage)
 
     def __sub__(self, other: "Vector[T]") -> "Vector[T]":
+        if is_lazy() or isinstance(other, Expr):
+            return Expr.leaf(self) - other
         self._check_same_size(other)
-        return Vector(a - b for a, b in zip(self, other))
+        return Vector._like((a - b for a, b in zip(self, other)), self.storage)
 
     def __mul__(self, k: T) -> "Vector[T]":
-        return Vector(k * x for x in self)
+        if is_lazy():
+            return Expr.leaf(self) * k
+        return Vector._like((k * x for x in self), self.storage)
     __rmul__ = __mul__
 
 